@@ -1,5 +1,6 @@
 """AST-based parser for Snowflake-specific SQL statements."""
 
+import re
 from typing import Any
 
 import sqlglot
@@ -7,6 +8,28 @@ from sqlglot import expressions as exp
 
 from mockhaus.my_logging import debug_log
 
+# Precompiled patterns for the regex-based COPY INTO fallback parser
+_WHITESPACE_RE = re.compile(r"\s+")
+# Pattern: COPY INTO table_name FROM 'stage_reference'
+# Handle quoted stage names like '@"my stage"/file'
+_COPY_INTO_RE = re.compile(r'COPY\s+INTO\s+(\w+)\s+FROM\s+([\'"]?@(?:[^\'"\s]+|\"[^\"]*\")+(?:/[^\'"\s]*)?[\'"]?)', re.IGNORECASE)
+# FILE_FORMAT = (FORMAT_NAME = 'name') or FILE_FORMAT = 'name'
+_FORMAT_NAME_RE = re.compile(r'FILE_FORMAT\s*=\s*\(\s*FORMAT_NAME\s*=\s*[\'"](\w+)[\'"]\s*\)', re.IGNORECASE)
+_FORMAT_DIRECT_RE = re.compile(r'FILE_FORMAT\s*=\s*[\'"](\w+)[\'"]', re.IGNORECASE)
+# FILE_FORMAT = (TYPE = 'CSV' FIELD_DELIMITER = ',' SKIP_HEADER = 1)
+_INLINE_FORMAT_RE = re.compile(r"FILE_FORMAT\s*=\s*\(([^)]+)\)", re.IGNORECASE)
+_TYPE_RE = re.compile(r"TYPE\s*=\s*['\"](\w+)['\"]", re.IGNORECASE)
+_FIELD_DELIMITER_RE = re.compile(r"FIELD_DELIMITER\s*=\s*['\"](.)['\"]", re.IGNORECASE)
+_SKIP_HEADER_RE = re.compile(r"SKIP_HEADER\s*=\s*(\d+)", re.IGNORECASE)
+_ENCLOSED_BY_RE = re.compile(r"FIELD_OPTIONALLY_ENCLOSED_BY\s*=\s*['\"](.)['\"]", re.IGNORECASE)
+_RECORD_DELIMITER_RE = re.compile(r"RECORD_DELIMITER\s*=\s*['\"]([^'\"]+)['\"]", re.IGNORECASE)
+_COMPRESSION_RE = re.compile(r"COMPRESSION\s*=\s*['\"](\w+)['\"]", re.IGNORECASE)
+_ON_ERROR_RE = re.compile(r'ON_ERROR\s*=\s*[\'"](\w+)[\'"]', re.IGNORECASE)
+_FORCE_RE = re.compile(r"\bFORCE\s*=\s*TRUE\b", re.IGNORECASE)
+_PURGE_RE = re.compile(r"\bPURGE\s*=\s*TRUE\b", re.IGNORECASE)
+_PATTERN_RE = re.compile(r'PATTERN\s*=\s*[\'"]([^\'\"]+)[\'"]', re.IGNORECASE)
+_VALIDATION_MODE_RE = re.compile(r'VALIDATION_MODE\s*=\s*[\'"](\w+)[\'"]', re.IGNORECASE)
+
 
 class SnowflakeASTParser:
     """Parser for Snowflake-specific SQL statements using sqlglot AST."""
@@ -412,16 +435,11 @@ class SnowflakeASTParser:
         Manual parsing of COPY INTO statement with improved regex patterns.
         """
         try:
-            import re
-
             # Normalize SQL
-            sql = re.sub(r"\s+", " ", sql.strip())
+            sql = _WHITESPACE_RE.sub(" ", sql.strip())
 
             # Extract table name and stage reference
-            # Pattern: COPY INTO table_name FROM 'stage_reference'
-            # Handle quoted stage names like '@"my stage"/file'
-            copy_pattern = r'COPY\s+INTO\s+(\w+)\s+FROM\s+([\'"]?@(?:[^\'"\s]+|\"[^\"]*\")+(?:/[^\'"\s]*)?[\'"]?)'
-            match = re.search(copy_pattern, sql, re.IGNORECASE)
+            match = _COPY_INTO_RE.search(sql)
 
             if not match:
                 return {"error": "Invalid COPY INTO syntax: could not extract table and stage"}
@@ -451,19 +469,10 @@ class SnowflakeASTParser:
 
     def _parse_copy_file_format(self, sql: str, result: dict[str, Any]) -> None:
         """Parse file format specification from COPY INTO statement."""
-        import re
-
-        # Look for FILE_FORMAT = (FORMAT_NAME = 'name') or FILE_FORMAT = 'name'
-        format_name_pattern = r'FILE_FORMAT\s*=\s*\(\s*FORMAT_NAME\s*=\s*[\'"](\w+)[\'"]\s*\)'
-        format_direct_pattern = r'FILE_FORMAT\s*=\s*[\'"](\w+)[\'"]'
-
-        # Look for inline format specification
-        # FILE_FORMAT = (TYPE = 'CSV' FIELD_DELIMITER = ',' SKIP_HEADER = 1)
-        inline_pattern = r"FILE_FORMAT\s*=\s*\(([^)]+)\)"
-
-        format_name_match = re.search(format_name_pattern, sql, re.IGNORECASE)
-        format_direct_match = re.search(format_direct_pattern, sql, re.IGNORECASE)
-        inline_match = re.search(inline_pattern, sql, re.IGNORECASE)
+        # Look for a named format or an inline format specification
+        format_name_match = _FORMAT_NAME_RE.search(sql)
+        format_direct_match = _FORMAT_DIRECT_RE.search(sql)
+        inline_match = _INLINE_FORMAT_RE.search(sql)
 
         if format_name_match:
             result["file_format_name"] = format_name_match.group(1)
@@ -477,28 +486,28 @@ class SnowflakeASTParser:
             inline_options = {}
 
             # Extract TYPE
-            type_match = re.search(r"TYPE\s*=\s*['\"](\w+)['\"]", inline_spec, re.IGNORECASE)
+            type_match = _TYPE_RE.search(inline_spec)
             if type_match:
                 inline_options["TYPE"] = type_match.group(1).upper()
 
             # Extract common CSV options
-            delimiter_match = re.search(r"FIELD_DELIMITER\s*=\s*['\"](.)['\"]", inline_spec, re.IGNORECASE)
+            delimiter_match = _FIELD_DELIMITER_RE.search(inline_spec)
             if delimiter_match:
                 inline_options["field_delimiter"] = delimiter_match.group(1)
 
-            header_match = re.search(r"SKIP_HEADER\s*=\s*(\d+)", inline_spec, re.IGNORECASE)
+            header_match = _SKIP_HEADER_RE.search(inline_spec)
             if header_match:
                 inline_options["skip_header"] = int(header_match.group(1))
 
-            quote_match = re.search(r"FIELD_OPTIONALLY_ENCLOSED_BY\s*=\s*['\"](.)['\"]", inline_spec, re.IGNORECASE)
+            quote_match = _ENCLOSED_BY_RE.search(inline_spec)
             if quote_match:
                 inline_options["field_optionally_enclosed_by"] = quote_match.group(1)
 
-            record_delimiter_match = re.search(r"RECORD_DELIMITER\s*=\s*['\"]([^'\"]+)['\"]", inline_spec, re.IGNORECASE)
+            record_delimiter_match = _RECORD_DELIMITER_RE.search(inline_spec)
             if record_delimiter_match:
                 inline_options["record_delimiter"] = record_delimiter_match.group(1)
 
-            compression_match = re.search(r"COMPRESSION\s*=\s*['\"](\w+)['\"]", inline_spec, re.IGNORECASE)
+            compression_match = _COMPRESSION_RE.search(inline_spec)
             if compression_match:
                 inline_options["compression"] = compression_match.group(1).upper()
 
@@ -506,31 +515,28 @@ class SnowflakeASTParser:
 
     def _parse_copy_other_options(self, sql: str, result: dict[str, Any]) -> None:
         """Parse other COPY INTO options like ON_ERROR, FORCE, etc."""
-        import re
-
         options = {}
 
         # ON_ERROR option
-        on_error_pattern = r'ON_ERROR\s*=\s*[\'"](\w+)[\'"]'
-        on_error_match = re.search(on_error_pattern, sql, re.IGNORECASE)
+        on_error_match = _ON_ERROR_RE.search(sql)
         if on_error_match:
             options["on_error"] = on_error_match.group(1).upper()
 
         # FORCE option
-        if re.search(r"\bFORCE\s*=\s*TRUE\b", sql, re.IGNORECASE):
+        if _FORCE_RE.search(sql):
             options["force"] = True
 
         # PURGE option
-        if re.search(r"\bPURGE\s*=\s*TRUE\b", sql, re.IGNORECASE):
+        if _PURGE_RE.search(sql):
             options["purge"] = True
 
         # PATTERN option
-        pattern_match = re.search(r'PATTERN\s*=\s*[\'"]([^\'\"]+)[\'"]', sql, re.IGNORECASE)
+        pattern_match = _PATTERN_RE.search(sql)
         if pattern_match:
             options["pattern"] = pattern_match.group(1)
 
         # VALIDATION_MODE option
-        validation_match = re.search(r'VALIDATION_MODE\s*=\s*[\'"](\w+)[\'"]', sql, re.IGNORECASE)
+        validation_match = _VALIDATION_MODE_RE.search(sql)
         if validation_match:
             options["validation_mode"] = validation_match.group(1).upper()
 
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+from ...my_logging import debug_log
+
 
 @dataclass
 class FileFormat:
@@ -34,7 +36,14 @@ class ValidationResult:
 
 
 class BaseFormatHandler(ABC):
-    """Base class for all format handlers."""
+    """
+    Base class for all format handlers.
+
+    Handlers must be stateless: the format registry shares one instance per format type.
+    Subclasses declare ``__slots__ = ()`` so instances cannot hold attributes.
+    """
+
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -62,11 +71,5 @@ class BaseFormatHandler(ABC):
         if not warnings:
             return
 
-        try:
-            from mockhaus.my_logging import debug_log
-
-            for warning in warnings:
-                debug_log(f"{self.format_type} format warning: {warning}")
-        except ImportError:
-            # Fallback - silent if logging not available
-            pass
+        for warning in warnings:
+            debug_log(f"{self.format_type} format warning: {warning}")
@@ -8,6 +8,8 @@ from .base import BaseFormatHandler, FormatMappingResult
 class CSVFormatHandler(BaseFormatHandler):
     """Handler for CSV format mappings with comprehensive Snowflake compatibility."""
 
+    __slots__ = ()
+
     @property
     def format_type(self) -> str:
         return "CSV"
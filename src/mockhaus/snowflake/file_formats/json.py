@@ -8,6 +8,8 @@ from .base import BaseFormatHandler, FormatMappingResult
 class JSONFormatHandler(BaseFormatHandler):
     """Handler for JSON format mappings."""
 
+    __slots__ = ()
+
     @property
     def format_type(self) -> str:
         return "JSON"
@@ -7,6 +7,7 @@ from typing import Any
 
 import duckdb
 
+from ...my_logging import debug_log
 from .base import FileFormat
 from .csv import CSVFormatHandler
 from .json import JSONFormatHandler
@@ -75,13 +76,7 @@ class MockFileFormatManager:
 
             # Store mapping result metadata for debugging
             if result.warnings or result.ignored_options:
-                try:
-                    from mockhaus.my_logging import debug_log
-
-                    debug_log(f"Format mapping for {file_format.name}: warnings={result.warnings}, ignored={result.ignored_options}")
-                except ImportError:
-                    # Fallback if logging not available
-                    pass
+                debug_log(f"Format mapping for {file_format.name}: warnings={result.warnings}, ignored={result.ignored_options}")
 
             return result.options
 
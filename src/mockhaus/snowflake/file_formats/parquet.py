@@ -8,6 +8,8 @@ from .base import BaseFormatHandler, FormatMappingResult
 class ParquetFormatHandler(BaseFormatHandler):
     """Handler for PARQUET format mappings."""
 
+    __slots__ = ()
+
     @property
     def format_type(self) -> str:
         return "PARQUET"
@@ -7,18 +7,23 @@ class FormatHandlerRegistry:
     """Registry for format handlers."""
 
     def __init__(self) -> None:
-        self._handlers: dict[str, type[BaseFormatHandler]] = {}
+        # Handlers are stateless (see BaseFormatHandler), so a single shared instance is kept per format type
+        self._handlers: dict[str, BaseFormatHandler] = {}
 
     def register(self, format_type: str, handler_class: type[BaseFormatHandler]) -> None:
         """Register a format handler."""
-        self._handlers[format_type.upper()] = handler_class
+        handler = handler_class()
+        if hasattr(handler, "__dict__"):
+            raise TypeError(f"{handler_class.__name__} must declare __slots__ = () so its shared instance stays stateless")
+        self._handlers[format_type.upper()] = handler
 
     def get_handler(self, format_type: str) -> BaseFormatHandler:
         """Get handler instance for format type."""
-        handler_class = self._handlers.get(format_type.upper())
-        if not handler_class:
+        # Callers almost always pass the canonical upper-case name, so only case fold on a miss
+        handler = self._handlers.get(format_type) or self._handlers.get(format_type.upper())
+        if not handler:
             raise ValueError(f"Unsupported format type: {format_type}")
-        return handler_class()
+        return handler
 
     def get_supported_formats(self) -> list[str]:
         """Get list of supported format types."""
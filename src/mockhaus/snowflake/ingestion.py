@@ -1,15 +1,56 @@
 """High-level Snowflake data ingestion operations."""
 
+import re
+from collections.abc import Callable
 from typing import Any
 
 import duckdb
 
-from ..my_logging import debug_log
 from .ast_parser import SnowflakeASTParser
 from .copy_into import CopyIntoTranslator
 from .file_formats import MockFileFormatManager
 from .stages import MockStageManager
 
+# Ingestion commands keyed by their first two keywords, so dispatch is a pair of dict lookups
+_INGESTION_COMMANDS: dict[str, dict[str, str]] = {
+    "CREATE": {"STAGE": "CREATE STAGE", "FILE": "CREATE FILE FORMAT"},
+    "COPY": {"INTO": "COPY INTO"},
+    "DROP": {"STAGE": "DROP STAGE", "FILE": "DROP FILE FORMAT"},
+}
+
+
+# Only the leading keywords matter for dispatch, so long statements are never copied in full
+_COMMAND_HEAD_LENGTH = 64
+_NON_WHITESPACE_RE = re.compile(r"\S")
+
+
+def _match_ingestion_command(sql: str) -> str | None:
+    """Return the ingestion command a statement starts with, if any."""
+    first = _NON_WHITESPACE_RE.search(sql)
+    if first is None:
+        return None
+
+    start = first.start()
+    tokens = sql[start : start + _COMMAND_HEAD_LENGTH].split(None, 3)
+    if len(tokens) < 2:
+        return None
+
+    command = _INGESTION_COMMANDS.get(tokens[0].upper(), {}).get(tokens[1].upper())
+    # FILE only names a command when followed by FORMAT
+    if command is not None and command.endswith(" FORMAT") and (len(tokens) < 3 or tokens[2].upper() != "FORMAT"):
+        return None
+    return command
+
+
+def _failure(error: str) -> dict[str, Any]:
+    """Build the result of an ingestion statement that did not run."""
+    return {"success": False, "rows_loaded": 0, "errors": [error]}
+
+
+def _ddl_result(success: bool, translated_sql: str, error: str = "") -> dict[str, Any]:
+    """Build the result of a stage or file format DDL statement; error is reported only on failure."""
+    return {"success": success, "rows_loaded": 0, "translated_sql": translated_sql, "errors": [] if success else [error]}
+
 
 class SnowflakeIngestionHandler:
     """Handles all Snowflake data ingestion operations."""
@@ -25,38 +66,32 @@ class SnowflakeIngestionHandler:
         self.format_manager = MockFileFormatManager(connection)
         self.copy_translator = CopyIntoTranslator(self.stage_manager, self.format_manager)
         self.ast_parser = SnowflakeASTParser()
+        self._command_handlers: dict[str, Callable[[str], dict[str, Any]]] = {
+            "CREATE STAGE": self._execute_create_stage,
+            "CREATE FILE FORMAT": self._execute_create_file_format,
+            "COPY INTO": self._execute_copy_into,
+            "DROP STAGE": self._execute_drop_stage,
+            "DROP FILE FORMAT": self._execute_drop_file_format,
+        }
 
     def is_data_ingestion_statement(self, sql: str) -> bool:
         """Check if SQL statement is a data ingestion statement."""
-        sql_upper = sql.strip().upper()
-        return (
-            sql_upper.startswith("CREATE STAGE")
-            or sql_upper.startswith("CREATE FILE FORMAT")
-            or sql_upper.startswith("COPY INTO")
-            or sql_upper.startswith("DROP STAGE")
-            or sql_upper.startswith("DROP FILE FORMAT")
-        )
+        return _match_ingestion_command(sql) is not None
 
     def execute_ingestion_statement(self, sql: str) -> dict[str, Any]:
         """Execute data ingestion statements."""
-        sql_upper = sql.strip().upper()
-        debug_log("we are here")
+        command = _match_ingestion_command(sql)
 
         try:
-            if sql_upper.startswith("CREATE STAGE"):
-                return self._execute_create_stage(sql)
-            if sql_upper.startswith("CREATE FILE FORMAT"):
-                return self._execute_create_file_format(sql)
-            if sql_upper.startswith("COPY INTO"):
-                debug_log("we are here 234")
-                return self.copy_translator.execute_copy_operation(sql, self.connection)
-            if sql_upper.startswith("DROP STAGE"):
-                return self._execute_drop_stage(sql)
-            if sql_upper.startswith("DROP FILE FORMAT"):
-                return self._execute_drop_file_format(sql)
-            return {"success": False, "rows_loaded": 0, "errors": [f"Unsupported data ingestion statement: {sql}"]}
+            if command is not None:
+                return self._command_handlers[command](sql)
+            return _failure(f"Unsupported data ingestion statement: {sql}")
         except Exception as e:
-            return {"success": False, "rows_loaded": 0, "errors": [str(e)]}
+            return _failure(str(e))
+
+    def _execute_copy_into(self, sql: str) -> dict[str, Any]:
+        """Execute COPY INTO statement."""
+        return self.copy_translator.execute_copy_operation(sql, self.connection)
 
     def _execute_create_stage(self, sql: str) -> dict[str, Any]:
         """Execute CREATE STAGE statement."""
@@ -64,7 +99,7 @@ class SnowflakeIngestionHandler:
         parsed = self.ast_parser.parse_create_stage(sql)
 
         if parsed["error"]:
-            return {"success": False, "rows_loaded": 0, "errors": [parsed["error"]]}
+            return _failure(parsed["error"])
 
         stage_name = parsed["stage_name"]
         stage_type = parsed["stage_type"]
@@ -73,7 +108,7 @@ class SnowflakeIngestionHandler:
         # Create the stage
         self.stage_manager.create_stage(stage_name, stage_type, url)
 
-        return {"success": True, "rows_loaded": 0, "translated_sql": f"-- Created stage {stage_name}", "errors": []}
+        return _ddl_result(True, f"-- Created stage {stage_name}")
 
     def _execute_create_file_format(self, sql: str) -> dict[str, Any]:
         """Execute CREATE FILE FORMAT statement."""
@@ -81,7 +116,7 @@ class SnowflakeIngestionHandler:
         parsed = self.ast_parser.parse_create_file_format(sql)
 
         if parsed["error"]:
-            return {"success": False, "rows_loaded": 0, "errors": [parsed["error"]]}
+            return _failure(parsed["error"])
 
         format_name = parsed["format_name"]
         format_type = parsed["format_type"]
@@ -90,7 +125,7 @@ class SnowflakeIngestionHandler:
         # Create the file format
         self.format_manager.create_format(format_name, format_type, properties)
 
-        return {"success": True, "rows_loaded": 0, "translated_sql": f"-- Created file format {format_name}", "errors": []}
+        return _ddl_result(True, f"-- Created file format {format_name}")
 
     def _execute_drop_stage(self, sql: str) -> dict[str, Any]:
         """Execute DROP STAGE statement."""
@@ -98,19 +133,14 @@ class SnowflakeIngestionHandler:
         parsed = self.ast_parser.parse_drop_stage(sql)
 
         if parsed["error"]:
-            return {"success": False, "rows_loaded": 0, "errors": [parsed["error"]]}
+            return _failure(parsed["error"])
 
         stage_name = parsed["stage_name"]
 
         # Drop the stage
         success = self.stage_manager.drop_stage(stage_name)
 
-        return {
-            "success": success,
-            "rows_loaded": 0,
-            "translated_sql": f"-- Dropped stage {stage_name}",
-            "errors": [] if success else [f"Stage {stage_name} not found"],
-        }
+        return _ddl_result(success, f"-- Dropped stage {stage_name}", f"Stage {stage_name} not found")
 
     def _execute_drop_file_format(self, sql: str) -> dict[str, Any]:
         """Execute DROP FILE FORMAT statement."""
@@ -118,16 +148,11 @@ class SnowflakeIngestionHandler:
         parsed = self.ast_parser.parse_drop_file_format(sql)
 
         if parsed["error"]:
-            return {"success": False, "rows_loaded": 0, "errors": [parsed["error"]]}
+            return _failure(parsed["error"])
 
         format_name = parsed["format_name"]
 
         # Drop the file format
         success = self.format_manager.drop_format(format_name)
 
-        return {
-            "success": success,
-            "rows_loaded": 0,
-            "translated_sql": f"-- Dropped file format {format_name}",
-            "errors": [] if success else [f"File format {format_name} not found"],
-        }
+        return _ddl_result(success, f"-- Dropped file format {format_name}", f"File format {format_name} not found")
@@ -1,15 +1,112 @@
 """Stage management for Mockhaus data ingestion."""
 
-from dataclasses import dataclass
+import fnmatch
+import functools
+import glob
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 import duckdb
-import os
 
 
-@dataclass
+def _parse_statement(sql: str) -> duckdb.Statement:
+    """Parse a statement once; executing the parsed form skips DuckDB's SQL parser on every call."""
+    return duckdb.extract_statements(sql)[0]
+
+
+# Hot stage metadata statements, parsed once and reused for every call. The DuckDB
+# Python API has no prepare(); parsed statements are the reusable handle it offers.
+_INSERT_STAGE = _parse_statement("""
+INSERT INTO mockhaus_stages
+(name, stage_type, url, local_path, properties)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+stage_type = excluded.stage_type, url = excluded.url, local_path = excluded.local_path, properties = excluded.properties
+""")
+_SELECT_STAGE = _parse_statement("SELECT * FROM mockhaus_stages WHERE name = ?")
+_SELECT_STAGES = _parse_statement("SELECT * FROM mockhaus_stages WHERE name IN (SELECT UNNEST(?::VARCHAR[]))")
+_SELECT_ALL_STAGES = _parse_statement("SELECT * FROM mockhaus_stages")
+_DELETE_STAGE = _parse_statement("DELETE FROM mockhaus_stages WHERE name = ? RETURNING local_path")
+
+# Schema statements, run when a MockStageManager is created
+_PROPERTIES_TYPE_SQL = """
+SELECT data_type FROM information_schema.columns
+WHERE table_name = 'mockhaus_stages' AND column_name = 'properties' AND table_schema = current_schema()
+"""
+_MIGRATE_PROPERTIES_SQL = """
+ALTER TABLE mockhaus_stages ALTER properties TYPE MAP(VARCHAR, VARCHAR)
+USING CAST(properties::JSON AS MAP(VARCHAR, VARCHAR))
+"""
+
+# Maximum number of stages kept in memory per connection
+_STAGE_CACHE_SIZE = 512
+
+# URL scheme prefixes that map onto a local stage directory
+_MAPPED_URL_SCHEMES = ("s3:", "gcs:", "azure:", "file:")
+
+
+@functools.cache
+def _default_stage_paths() -> tuple[Path, Path, Path, Path, Path]:
+    """
+    Return the base, stages, tables, user and external directories under ~/.mockhaus.
+
+    Resolving the home directory can hit the password database, so it is done once per
+    process rather than for every MockStageManager.
+    """
+    base_path = Path.home() / ".mockhaus"
+    return base_path, base_path / "stages", base_path / "tables", base_path / "user", base_path / "external"
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_file_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern into a case-sensitive regex matching a whole file name."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+@functools.lru_cache(maxsize=2048)
+def _resolve_stage_reference(stage_reference: str, user_path: str, tables_path: str, stages_path: str, stage_local_path: str | None) -> str:
+    """Resolve an @-prefixed stage reference to a local path.
+
+    Pure function of its arguments, so results are memoized; the stage's local path
+    is part of the key, which keeps entries valid across stage create/drop.
+    """
+    # Remove the @ prefix
+    ref = stage_reference[1:]
+
+    # Handle user stage (@~)
+    if ref.startswith("~/"):
+        file_path = ref[2:]  # Remove ~/
+        return str(Path(user_path) / file_path)
+
+    # Handle table internal stage (@%table_name)
+    if ref.startswith("%"):
+        # Extract table name and file path
+        parts = ref[1:].split("/", 1)  # Remove %
+        table_name = parts[0]
+        file_path = parts[1] if len(parts) > 1 else ""
+        return str(Path(tables_path) / table_name / file_path)
+
+    # Handle named stage (@stage_name/path)
+    parts = ref.split("/", 1)
+    stage_name = parts[0]
+    file_path = parts[1] if len(parts) > 1 else ""
+
+    if stage_local_path is not None:
+        return str(Path(stage_local_path) / file_path)
+
+    # If stage doesn't exist, assume it's a named stage
+    return str(Path(stages_path) / stage_name / file_path)
+
+
+@dataclass(slots=True)
 class Stage:
     """Represents a Snowflake stage in Mockhaus."""
 
@@ -25,22 +122,56 @@ class Stage:
             self.properties = {}
 
 
+def _copy_stage(stage: Stage) -> Stage:
+    """Copy a stage, including its properties, so the copy can be modified freely."""
+    return replace(stage, properties=dict(stage.properties or {}))
+
+
+# Stage caches keyed by connection, so every manager on a connection sees the others' creates and drops;
+# an entry goes away with its connection
+_STAGE_CACHES: weakref.WeakKeyDictionary[duckdb.DuckDBPyConnection, tuple[OrderedDict[str, Stage], threading.Lock]] = weakref.WeakKeyDictionary()
+_STAGE_CACHES_LOCK = threading.Lock()
+
+
+def _shared_stage_cache(connection: duckdb.DuckDBPyConnection) -> tuple[OrderedDict[str, Stage], threading.Lock]:
+    """Return the stage cache and its lock for a connection, creating them on first use."""
+    with _STAGE_CACHES_LOCK:
+        cache = _STAGE_CACHES.get(connection)
+        if cache is None:
+            cache = _STAGE_CACHES[connection] = (OrderedDict(), threading.Lock())
+        return cache
+
+
 class MockStageManager:
     """Manages Snowflake stages using local file system."""
 
     def __init__(self, connection: duckdb.DuckDBPyConnection) -> None:
         """Initialize stage manager with DuckDB connection."""
         self.connection = connection
-        self.base_path = Path.home() / ".mockhaus"
-        self.stages_path = self.base_path / "stages"
-        self.tables_path = self.base_path / "tables"
-        self.user_path = self.base_path / "user"
-        self.external_path = self.base_path / "external"
+        self.base_path, self.stages_path, self.tables_path, self.user_path, self.external_path = _default_stage_paths()
+        self._user_path_str = str(self.user_path)
+        self._tables_path_str = str(self.tables_path)
+        self._stages_path_str = str(self.stages_path)
+
+        # Stage type -> local path builder, used by _determine_local_path
+        self._path_builders: dict[str, Callable[[str, str | None], str]] = {
+            "USER": self._user_stage_path,
+            "INTERNAL": self._table_stage_path,
+            "TABLE": self._table_stage_path,
+            "EXTERNAL": self._external_stage_path,
+        }
+
+        # LRU cache of get_stage results, shared by every manager on the connection and kept in sync by create/drop
+        self._stage_cache, self._stage_cache_lock = _shared_stage_cache(connection)
 
         # Create base directories
         self._ensure_directories()
         self._create_system_tables()
 
+        # mockhaus_stages may have been changed outside any manager (e.g. dropped), so start from the table
+        with self._stage_cache_lock:
+            self._stage_cache.clear()
+
     def _ensure_directories(self) -> None:
         """Create necessary directories for stage operations."""
         for path in [self.base_path, self.stages_path, self.tables_path, self.user_path, self.external_path]:
@@ -54,120 +185,169 @@ class MockStageManager:
             stage_type VARCHAR NOT NULL,
             url VARCHAR,
             local_path VARCHAR NOT NULL,
-            properties JSON,
+            properties MAP(VARCHAR, VARCHAR),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """
         self.connection.execute(create_stages_table)
+        self._migrate_json_properties()
+
+    def _migrate_json_properties(self) -> None:
+        """Convert a mockhaus_stages table from older releases, which kept properties as JSON, to a MAP column."""
+        column = self.connection.execute(_PROPERTIES_TYPE_SQL).fetchone()
+        if column and column[0] in ("JSON", "VARCHAR"):
+            self.connection.execute(_MIGRATE_PROPERTIES_SQL)
 
     def create_stage(self, name: str, stage_type: str = "USER", url: str | None = None, properties: dict[str, Any] | None = None) -> Stage:
         """Create a new stage."""
-        if properties is None:
-            properties = {}
+        stage = self._build_stage(Stage(name=name, stage_type=stage_type, url=url, properties=properties))
+
+        # Store in system table
+        self._store_stage_metadata(stage)
+        self._invalidate_stage(name)
+
+        return stage
+
+    def create_stages(self, stages: list[Stage]) -> list[Stage]:
+        """Create several stages, storing their metadata in a single batch."""
+        created = [self._build_stage(stage) for stage in stages]
+        if created:
+            self.connection.executemany(_INSERT_STAGE, [self._stage_row(stage) for stage in created])
+        for stage in created:
+            self._invalidate_stage(stage.name)
+        return created
+
+    def _build_stage(self, stage: Stage) -> Stage:
+        """Resolve the local path and normalized URL for a stage and create its directory."""
+        url = stage.url
 
         # Determine local path based on stage type and URL
-        local_path = self._determine_local_path(name, stage_type, url)
+        local_path = self._determine_local_path(stage.name, stage.stage_type, url)
 
         # Create the directory
         Path(local_path).mkdir(parents=True, exist_ok=True)
 
         # Create stage object
-        if url and url.startswith("file://"): 
+        if url and url.startswith("file://"):
             url = "file://" + str(Path(url[7:]).as_posix())
-        stage = Stage(name=name, stage_type=stage_type, url=url, local_path=local_path, properties=properties)
-
-        # Store in system table
-        self._store_stage_metadata(stage)
-
-        return stage
+        return Stage(name=stage.name, stage_type=stage.stage_type, url=url, local_path=local_path, properties=stage.properties)
 
     def _determine_local_path(self, name: str, stage_type: str, url: str | None) -> str:
         """Determine local path for a stage based on type and URL."""
-        if stage_type == "USER":
-            return str(self.user_path / name)
-        if stage_type == "INTERNAL" or stage_type == "TABLE":
-            return str(self.tables_path / name)
-        if stage_type == "EXTERNAL":
-            if url:
-                # Parse URL to create meaningful local path
-                parsed = urlparse(url)
-                if parsed.scheme in ["s3", "gcs", "azure"]:
-                    path = os.path.join(self.external_path, parsed.scheme, parsed.netloc, parsed.path.strip("/"))
-                    return os.path.normpath(path)
-                if parsed.scheme == "file":
-                    # For file:// URLs, use the actual local path
-                    path = parsed.path
-                    if parsed.netloc:
-                        path = parsed.netloc + path
-                    return str(Path(path))
-                return str(self.external_path / name)
-            return str(self.external_path / name)
-        # Default to named stage
+        # Unknown stage types default to a named stage
+        return self._path_builders.get(stage_type, self._named_stage_path)(name, url)
+
+    def _user_stage_path(self, name: str, _url: str | None) -> str:
+        """Local path for a USER stage."""
+        return str(self.user_path / name)
+
+    def _table_stage_path(self, name: str, _url: str | None) -> str:
+        """Local path for an INTERNAL or TABLE stage."""
+        return str(self.tables_path / name)
+
+    def _external_stage_path(self, name: str, url: str | None) -> str:
+        """Local path for an EXTERNAL stage, derived from its URL when possible."""
+        # Only URLs with a mapped scheme need parsing; others fall back to the named directory
+        if url and url[:6].lower().startswith(_MAPPED_URL_SCHEMES):
+            # Parse URL to create meaningful local path
+            parsed = urlparse(url)
+            if parsed.scheme in ["s3", "gcs", "azure"]:
+                path = os.path.join(self.external_path, parsed.scheme, parsed.netloc, parsed.path.strip("/"))
+                return os.path.normpath(path)
+            if parsed.scheme == "file":
+                # For file:// URLs, use the actual local path
+                path = parsed.path
+                if parsed.netloc:
+                    path = parsed.netloc + path
+                return str(Path(path))
+        return str(self.external_path / name)
+
+    def _named_stage_path(self, name: str, _url: str | None) -> str:
+        """Local path for a named stage."""
         return str(self.stages_path / name)
 
-    def _store_stage_metadata(self, stage: Stage) -> None:
-        """Store stage metadata in system table."""
-        insert_sql = """
-        INSERT OR REPLACE INTO mockhaus_stages
-        (name, stage_type, url, local_path, properties)
-        VALUES (?, ?, ?, ?, ?)
+    @staticmethod
+    def _stage_row(stage: Stage) -> list[Any]:
+        """Build the parameter row used to store a stage.
+
+        Properties are bound as a Python dict, which DuckDB stores natively as a MAP;
+        like Snowflake stage parameters, their values are kept as strings.
         """
-        import json
+        return [stage.name, stage.stage_type, stage.url, stage.local_path, stage.properties]
 
-        self.connection.execute(insert_sql, [stage.name, stage.stage_type, stage.url, stage.local_path, json.dumps(stage.properties)])
+    def _store_stage_metadata(self, stage: Stage) -> None:
+        """Store stage metadata in system table."""
+        self.connection.execute(_INSERT_STAGE, self._stage_row(stage))
 
     def get_stage(self, name: str) -> Stage | None:
-        """Get stage by name."""
-        result = self.connection.execute("SELECT * FROM mockhaus_stages WHERE name = ?", [name]).fetchone()
-
-        if not result:
-            return None
-
-        import json
+        """Get stage by name, serving repeated lookups from the in-memory cache."""
+        stage = self._lookup_stage(name)
+        # Hand out a copy so changes made by the caller never reach the cached stage
+        return _copy_stage(stage) if stage else None
+
+    def _lookup_stage(self, name: str) -> Stage | None:
+        """Return the cached stage, loading it on a miss. The result is shared and must not be modified."""
+        with self._stage_cache_lock:
+            stage = self._stage_cache.get(name)
+            if stage is not None:
+                self._stage_cache.move_to_end(name)
+                return stage
+
+        # Misses are not cached: the stage may be created later
+        stage = self._fetch_stage(name)
+        if stage is not None:
+            self._cache_stage(stage)
+        return stage
 
+    def _cache_stage(self, stage: Stage) -> None:
+        """Remember a stage, evicting the least recently used entry when full."""
+        with self._stage_cache_lock:
+            self._stage_cache[stage.name] = stage
+            self._stage_cache.move_to_end(stage.name)
+            if len(self._stage_cache) > _STAGE_CACHE_SIZE:
+                self._stage_cache.popitem(last=False)
+
+    def _fetch_stage(self, name: str) -> Stage | None:
+        """Load a stage from the system table."""
+        result = self.connection.execute(_SELECT_STAGE, [name]).fetchone()
+        return self._row_to_stage(result) if result else None
+
+    @staticmethod
+    def _row_to_stage(result: tuple[Any, ...]) -> Stage:
+        """Build a Stage from a mockhaus_stages row."""
         return Stage(
             name=result[0],
             stage_type=result[1],
             url=result[2],
             local_path=result[3],
-            properties=json.loads(result[4]) if result[4] else {},
+            properties=result[4] or {},
             created_at=result[5],
         )
 
     def list_stages(self) -> list[Stage]:
-        """List all stages."""
-        results = self.connection.execute("SELECT * FROM mockhaus_stages").fetchall()
-        stages = []
-
-        import json
-
-        for result in results:
-            stages.append(
-                Stage(
-                    name=result[0],
-                    stage_type=result[1],
-                    url=result[2],
-                    local_path=result[3],
-                    properties=json.loads(result[4]) if result[4] else {},
-                    created_at=result[5],
-                )
-            )
-
-        return stages
+        """List all stages, warming the lookup cache with every stage read."""
+        results = self.connection.execute(_SELECT_ALL_STAGES).fetchall()
+        stages = [self._row_to_stage(result) for result in results]
+        for stage in stages:
+            self._cache_stage(stage)
+        return [_copy_stage(stage) for stage in stages]
 
     def drop_stage(self, name: str) -> bool:
         """Drop a stage and optionally remove its directory."""
-        stage = self.get_stage(name)
-        if not stage:
-            return False
-
-        # Remove from system table
-        self.connection.execute("DELETE FROM mockhaus_stages WHERE name = ?", [name])
+        # Remove from system table; RETURNING tells us whether the stage existed
+        deleted = self.connection.execute(_DELETE_STAGE, [name]).fetchone()
+        self._invalidate_stage(name)
 
         # Optionally remove directory (commented out for safety)
-        # shutil.rmtree(stage.local_path, ignore_errors=True)
+        # if deleted:
+        #     shutil.rmtree(deleted[0], ignore_errors=True)
+
+        return deleted is not None
 
-        return True
+    def _invalidate_stage(self, name: str) -> None:
+        """Forget any cached lookup for a stage."""
+        with self._stage_cache_lock:
+            self._stage_cache.pop(name, None)
 
     def resolve_stage_path(self, stage_reference: str) -> str | None:
         """
@@ -178,59 +358,73 @@ class MockStageManager:
         - @%table_name/file.csv → ~/.mockhaus/tables/table_name/file.csv
         - @~/file.csv → ~/.mockhaus/user/file.csv
         """
-        if not stage_reference.startswith("@"):
+        if not stage_reference or stage_reference[0] != "@":
             return None
 
-        # Remove the @ prefix
-        ref = stage_reference[1:]
-
-        # Handle user stage (@~)
-        if ref.startswith("~/"):
-            file_path = ref[2:]  # Remove ~/
-            return str(self.user_path / file_path)
-
-        # Handle table internal stage (@%table_name)
-        if ref.startswith("%"):
-            # Extract table name and file path
-            parts = ref[1:].split("/", 1)  # Remove %
-            table_name = parts[0]
-            file_path = parts[1] if len(parts) > 1 else ""
-            return str(self.tables_path / table_name / file_path)
-
-        # Handle named stage (@stage_name/path)
-        parts = ref.split("/", 1)
-        stage_name = parts[0]
-        file_path = parts[1] if len(parts) > 1 else ""
+        # Named stages resolve against their stored local path
+        stage_local_path = None
+        if not stage_reference.startswith(("~/", "%"), 1):
+            stage = self._lookup_stage(stage_reference[1:].partition("/")[0])
+            if stage:
+                stage_local_path = stage.local_path
 
-        # Look up stage
-        stage = self.get_stage(stage_name)
-        if stage:
-            return str(Path(stage.local_path) / file_path)
+        return _resolve_stage_reference(stage_reference, self._user_path_str, self._tables_path_str, self._stages_path_str, stage_local_path)
 
-        # If stage doesn't exist, assume it's a named stage
-        return str(self.stages_path / stage_name / file_path)
+    def resolve_stage_paths(self, stage_references: list[str]) -> list[str | None]:
+        """
+        Resolve many stage references at once.
+
+        Named stages that are not cached yet are loaded with a single query, after
+        which each reference resolves without further database round-trips.
+        """
+        stage_names = {ref[1:].partition("/")[0] for ref in stage_references if ref and ref[0] == "@" and not ref.startswith(("~/", "%"), 1)}
+        with self._stage_cache_lock:
+            missing = [name for name in stage_names if name not in self._stage_cache]
+
+        if missing:
+            for row in self.connection.execute(_SELECT_STAGES, [missing]).fetchall():
+                self._cache_stage(self._row_to_stage(row))
+
+        return [self.resolve_stage_path(ref) for ref in stage_references]
 
     def list_stage_files(self, stage_reference: str, pattern: str = "*") -> list[str]:
-        """List files in a stage directory."""
+        """List files in a stage directory, sorted by path."""
+        return sorted(self.iter_stage_files(stage_reference, pattern))
+
+    def iter_stage_files(self, stage_reference: str, pattern: str = "*") -> Iterator[str]:
+        """
+        Yield files in a stage directory as they are found.
+
+        Files come in file system order; use list_stage_files for a sorted listing.
+        """
         base_path = self.resolve_stage_path(stage_reference)
         if not base_path:
-            return []
+            return
 
         # Remove filename if present, get directory
-        path = Path(base_path)
-        if not path.is_dir():
-            path = path.parent
-
-        if not path.exists():
-            return []
-
-        # List files matching pattern
-        files = []
-        for file_path in path.glob(pattern):
-            if file_path.is_file():
-                files.append(str(file_path))
-
-        return sorted(files)
+        directory = base_path if os.path.isdir(base_path) else os.path.dirname(base_path)
+
+        # Patterns that reach into subdirectories still need a full glob; glob.iglob works on plain
+        # strings, so no Path object is built per match
+        if "/" in pattern or "**" in pattern:
+            for match in glob.iglob(pattern, root_dir=directory, recursive=True, include_hidden=True):
+                file_path = os.path.join(directory, match)
+                if os.path.isfile(file_path):
+                    yield file_path
+            return
+
+        # Single-level listing: scandir entries carry their file type, avoiding a stat per file,
+        # and a missing directory surfaces from scandir itself rather than a separate exists() check
+        name_matches = _compile_file_pattern(pattern).match
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        with entries:
+            for entry in entries:
+                if name_matches(entry.name) and entry.is_file():
+                    yield entry.path
 
     def validate_stage_access(self, stage_reference: str) -> bool:
         """Validate that a stage reference can be accessed."""
@@ -238,9 +432,9 @@ class MockStageManager:
         if not resolved_path:
             return False
 
-        path = Path(resolved_path)
-        # Check if it's a file or if parent directory exists
-        return path.exists() or path.parent.exists()
+        path = os.path.normpath(resolved_path)
+        # Check if it's a file or if parent directory exists; each check is a single stat
+        return os.path.exists(path) or os.path.exists(os.path.dirname(path))
 
     def ensure_stage_directory(self, stage_reference: str) -> str:
         """Ensure stage directory exists and return the path."""
@@ -248,11 +442,10 @@ class MockStageManager:
         if not resolved_path:
             raise ValueError(f"Invalid stage reference: {stage_reference}")
 
-        path = Path(resolved_path)
+        path = os.path.normpath(resolved_path)
         # If it looks like a file path, create parent directory
-        if path.suffix != "" or "." in path.name:
-            path.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            path.mkdir(parents=True, exist_ok=True)
+        if "." in os.path.basename(path):
+            path = os.path.dirname(path)
+        os.makedirs(path, exist_ok=True)
 
         return resolved_path
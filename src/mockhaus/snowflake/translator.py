@@ -1,12 +1,128 @@
 """SQL translation engine for converting Snowflake SQL to DuckDB SQL."""
 
+import functools
+import os
+from dataclasses import dataclass
 from typing import Any
 
 import sqlglot
+from sqlglot import expressions as exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.tokens import TokenType
 
 from ..sqlglot.dialects import CustomDuckDB, CustomSnowflake
 
 
+@dataclass(frozen=True)
+class _CompiledTranslation:
+    """A parsed Snowflake query together with its generated DuckDB SQL and the rewrites applied."""
+
+    parsed: exp.Expression
+    duckdb_sql: str
+    transformations: frozenset[str]
+
+
+@functools.cache
+def _dialect(dialect_class: type[Dialect]) -> Dialect:
+    """
+    Return the shared instance of a dialect.
+
+    Dialect instances are immutable settings holders, so one per class is reused for every
+    parse, tokenize and generate instead of building a new one per statement. Parsers and
+    generators keep per-statement state and are still created per call.
+    """
+    return dialect_class()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse(snowflake_sql: str, source_dialect: type[Dialect]) -> exp.Expression:
+    """Parse a query once, so every rendering of it shares the same AST."""
+    return sqlglot.parse_one(snowflake_sql, dialect=_dialect(source_dialect))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(snowflake_sql: str, source_dialect: type[Dialect], target_dialect: type[Dialect], pretty: bool = False) -> _CompiledTranslation:
+    """
+    Parse and regenerate a query once, memoizing the result.
+
+    Translation is a pure function of the SQL text, the dialect pair and the
+    output style, so repeated queries skip the sqlglot parse/generate pipeline
+    entirely, and translate() and get_translation_info() share the same parse.
+    """
+    parsed = _parse(snowflake_sql, source_dialect)
+    # Drive the generator directly so the rewrites it records can be read back
+    generator = _dialect(target_dialect).generator(pretty=pretty)
+    duckdb_sql = generator.generate(parsed)
+    return _CompiledTranslation(parsed=parsed, duckdb_sql=duckdb_sql, transformations=frozenset(getattr(generator, "applied_transformations", ())))
+
+
+# Tokens whose meaning and spelling are identical in Snowflake and DuckDB. A statement built only from
+# these (no function calls, casts, parameters or dialect keywords) needs no rewriting. ORDER BY is
+# excluded: Snowflake sorts NULLs as the largest value, so sqlglot adds explicit NULLS FIRST/LAST.
+_PASSTHROUGH_TOKENS = frozenset(
+    {
+        TokenType.SELECT, TokenType.UPDATE, TokenType.SET, TokenType.DELETE, TokenType.FROM, TokenType.WHERE,
+        TokenType.JOIN, TokenType.INNER, TokenType.LEFT, TokenType.RIGHT, TokenType.FULL, TokenType.OUTER,
+        TokenType.CROSS, TokenType.ON, TokenType.GROUP_BY, TokenType.HAVING, TokenType.LIMIT, TokenType.OFFSET,
+        TokenType.DISTINCT, TokenType.ALIAS, TokenType.AND, TokenType.OR, TokenType.NOT, TokenType.IS,
+        TokenType.NULL, TokenType.TRUE, TokenType.FALSE, TokenType.LIKE, TokenType.ILIKE, TokenType.BETWEEN,
+        TokenType.EQ, TokenType.NEQ, TokenType.LT, TokenType.LTE, TokenType.GT, TokenType.GTE, TokenType.PLUS,
+        TokenType.DASH, TokenType.SLASH, TokenType.MOD, TokenType.DPIPE, TokenType.COMMA, TokenType.DOT,
+        TokenType.STAR, TokenType.VAR, TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING,
+    }
+)  # fmt: skip
+_PASSTHROUGH_STATEMENTS = frozenset({TokenType.SELECT, TokenType.UPDATE, TokenType.DELETE})
+
+# Tokens that end an operand; a bare word right after one is an implicit alias or a contextual
+# keyword (NULLS LAST, AT, ...) that the parser may rewrite
+_OPERAND_END_TOKENS = frozenset(
+    {TokenType.VAR, TokenType.IDENTIFIER, TokenType.NUMBER, TokenType.STRING, TokenType.NULL, TokenType.TRUE, TokenType.FALSE}
+)
+
+
+@functools.cache
+def _passthrough_enabled() -> bool:
+    """Check once whether the pass-through fast path is enabled (disable with MOCKHAUS_TRANSLATION_FAST_PATH=false)."""
+    return os.environ.get("MOCKHAUS_TRANSLATION_FAST_PATH", "").lower() not in ("false", "0", "no")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_passthrough(snowflake_sql: str, source_dialect: type[Dialect], target_dialect: type[Dialect]) -> bool:
+    """
+    Check whether a statement is already valid DuckDB SQL with the same meaning.
+
+    Only the tokenizer runs, which is far cheaper than a full parse and regeneration.
+    Backslash escapes and // comments are Snowflake-only, so statements containing them
+    always take the full translation path.
+    """
+    if "\\" in snowflake_sql or "//" in snowflake_sql:
+        return False
+
+    try:
+        tokens = _dialect(source_dialect).tokenize(snowflake_sql)
+    except Exception:
+        return False
+
+    if not tokens or tokens[0].token_type not in _PASSTHROUGH_STATEMENTS:
+        return False
+
+    reserved = target_dialect.generator_class.RESERVED_KEYWORDS
+    previous: TokenType | None = None
+    for index, token in enumerate(tokens):
+        token_type = token.token_type
+        if token_type not in _PASSTHROUGH_TOKENS:
+            return False
+        # Bare words must be plain identifiers: not after an operand and not reserved in DuckDB
+        if token_type == TokenType.VAR and (previous in _OPERAND_END_TOKENS or token.text.lower() in reserved):
+            return False
+        # Only SELECT * / table.* projections; arithmetic with * goes through sqlglot
+        if token_type == TokenType.STAR and index + 1 < len(tokens) and tokens[index + 1].token_type not in (TokenType.FROM, TokenType.COMMA):
+            return False
+        previous = token_type
+
+    return True
+
+
 class SnowflakeToDuckDBTranslator:
     """Translates Snowflake SQL queries to DuckDB SQL."""
 
@@ -14,13 +130,16 @@ class SnowflakeToDuckDBTranslator:
         """Initialize the translator."""
         self.source_dialect = CustomSnowflake
         self.target_dialect = CustomDuckDB
+        self._source_dialect_name = getattr(self.source_dialect, "__name__", str(self.source_dialect))
+        self._target_dialect_name = getattr(self.target_dialect, "__name__", str(self.target_dialect))
 
-    def translate(self, snowflake_sql: str) -> str:
+    def translate(self, snowflake_sql: str, *, pretty: bool = False) -> str:
         """
         Translate a Snowflake SQL query to DuckDB SQL.
 
         Args:
             snowflake_sql: The Snowflake SQL query to translate
+            pretty: Format the output for humans; DuckDB itself does not need it
 
         Returns:
             The translated DuckDB SQL query
@@ -29,12 +148,13 @@ class SnowflakeToDuckDBTranslator:
             ValueError: If the SQL cannot be parsed or translated
         """
         try:
-            # Parse the Snowflake SQL using custom dialect
-            parsed = sqlglot.parse_one(snowflake_sql, dialect=self.source_dialect)
+            # Statements that are already plain DuckDB SQL skip the sqlglot pipeline
+            if not pretty and _passthrough_enabled() and _is_passthrough(snowflake_sql, self.source_dialect, self.target_dialect):
+                return snowflake_sql
 
-            # Generate DuckDB SQL using custom dialect
-            # The dialects handle the SYSDATE transformation automatically
-            return parsed.sql(dialect=self.target_dialect, pretty=True)
+            # Parse with the custom Snowflake dialect and generate with the custom DuckDB one;
+            # the dialects handle the SYSDATE transformation automatically
+            return _compile(snowflake_sql, self.source_dialect, self.target_dialect, pretty).duckdb_sql
 
         except Exception as e:
             raise ValueError(f"Failed to translate SQL: {snowflake_sql}. Error: {str(e)}") from e
@@ -50,54 +170,53 @@ class SnowflakeToDuckDBTranslator:
             Dictionary containing translation details
         """
         try:
-            parsed = sqlglot.parse_one(snowflake_sql, dialect=self.source_dialect)
-            duckdb_sql = parsed.sql(dialect=self.target_dialect, pretty=True)
+            # Translation info is read by people, so it keeps the pretty-printed form
+            compiled = _compile(snowflake_sql, self.source_dialect, self.target_dialect, True)
+            duckdb_sql = compiled.duckdb_sql
 
             return {
                 "original_sql": snowflake_sql,
                 "translated_sql": duckdb_sql,
-                "source_dialect": self.source_dialect.__name__ if hasattr(self.source_dialect, "__name__") else str(self.source_dialect),
-                "target_dialect": self.target_dialect.__name__ if hasattr(self.target_dialect, "__name__") else str(self.target_dialect),
+                "source_dialect": self._source_dialect_name,
+                "target_dialect": self._target_dialect_name,
                 "success": True,
                 "error": None,
-                "transformations_applied": self._get_applied_transformations(snowflake_sql, duckdb_sql),
+                "transformations_applied": self._get_applied_transformations(snowflake_sql, compiled),
             }
 
         except Exception as e:
             return {
                 "original_sql": snowflake_sql,
                 "translated_sql": None,
-                "source_dialect": self.source_dialect.__name__ if hasattr(self.source_dialect, "__name__") else str(self.source_dialect),
-                "target_dialect": self.target_dialect.__name__ if hasattr(self.target_dialect, "__name__") else str(self.target_dialect),
+                "source_dialect": self._source_dialect_name,
+                "target_dialect": self._target_dialect_name,
                 "success": False,
                 "error": str(e),
                 "transformations_applied": [],
             }
 
-    def _get_applied_transformations(self, original_sql: str, translated_sql: str) -> list[str]:
+    def _get_applied_transformations(self, original_sql: str, compiled: _CompiledTranslation) -> list[str]:
         """Get a list of transformations that were applied."""
-        transformations = []
-
-        # Check if SYSDATE was transformed
-        if "SYSDATE(" in original_sql.upper() and "CURRENT_TIMESTAMP AT TIME ZONE" in translated_sql.upper():
-            transformations.append("sysdate_to_utc")
+        # Snowflake-specific rewrites are recorded by the generator as it renders them
+        transformations = sorted(compiled.transformations)
 
         # Check if there are other differences indicating transformation
-        if original_sql.strip() != translated_sql.strip():
+        if original_sql.strip() != compiled.duckdb_sql.strip():
             transformations.append("dialect_translation")
 
         return transformations
 
 
-def translate_snowflake_to_duckdb(sql: str) -> str:
+def translate_snowflake_to_duckdb(sql: str, *, pretty: bool = False) -> str:
     """
     Convenience function to translate Snowflake SQL to DuckDB SQL.
 
     Args:
         sql: The Snowflake SQL query to translate
+        pretty: Format the output for humans
 
     Returns:
         The translated DuckDB SQL query
     """
     translator = SnowflakeToDuckDBTranslator()
-    return translator.translate(sql)
+    return translator.translate(sql, pretty=pretty)
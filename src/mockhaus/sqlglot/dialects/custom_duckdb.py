@@ -1,75 +1,96 @@
 """Custom DuckDB dialect for handling Snowflake-specific functions."""
 
+import re
+from typing import Any
+
 from sqlglot import expressions as exp
 from sqlglot.dialects.duckdb import DuckDB
 
 from .expressions import IdentifierFunc, Sysdate
 
+# Identifiers DuckDB accepts unquoted (when not a reserved keyword)
+_PLAIN_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
 
-class CustomDuckDBGenerator(DuckDB.Generator):
-    """Extended DuckDB SQL generator that knows how to handle Snowflake functions."""
+# DuckDB rendering of SYSDATE(), bare and wrapped for CREATE TABLE DEFAULT clauses
+_UTC_SYSDATE = "CURRENT_TIMESTAMP AT TIME ZONE 'UTC'"
+_UTC_SYSDATE_PARENS = f"({_UTC_SYSDATE})"
 
-    def sysdate_sql(self, expression: Sysdate) -> str:
-        """
-        Generate DuckDB SQL for Snowflake's SYSDATE() function.
 
-        SYSDATE() in Snowflake returns current UTC timestamp.
-        In DuckDB, we translate this to CURRENT_TIMESTAMP AT TIME ZONE 'UTC'.
+def _sysdate_sql(self: "CustomDuckDBGenerator", _: Sysdate) -> str:
+    """
+    Generate DuckDB SQL for Snowflake's SYSDATE() function.
 
-        For CREATE TABLE DEFAULT clauses, we need to wrap complex expressions
-        in parentheses for proper SQL syntax.
-        """
-        # Create the AT TIME ZONE expression
-        utc_expr = "CURRENT_TIMESTAMP AT TIME ZONE 'UTC'"
+    SYSDATE() in Snowflake returns current UTC timestamp.
+    In DuckDB, we translate this to CURRENT_TIMESTAMP AT TIME ZONE 'UTC'.
 
-        # Check if we need parentheses based on context
-        if self._needs_parentheses_for_sysdate(expression):
-            return f"({utc_expr})"
+    For CREATE TABLE DEFAULT clauses, we need to wrap complex expressions
+    in parentheses for proper SQL syntax.
+    """
+    self.applied_transformations.add("sysdate_to_utc")
 
-        return utc_expr
+    # Check if we need parentheses based on context; every SYSDATE in a CREATE statement does
+    if self._in_create_statement or self._needs_parentheses_for_sysdate():
+        return _UTC_SYSDATE_PARENS
 
-    def _needs_parentheses_for_sysdate(self, expression: Sysdate) -> bool:
-        """
-        Determine if SYSDATE translation needs parentheses.
+    return _UTC_SYSDATE
 
-        We need parentheses in CREATE TABLE DEFAULT clauses where
-        complex expressions like 'AT TIME ZONE' need to be wrapped.
-        """
-        # Walk up the parent chain to check context
-        current: exp.Expression = expression
-        depth = 0
-        max_depth = 10  # Prevent infinite loops
 
-        while hasattr(current, "parent") and current.parent and depth < max_depth:
-            current = current.parent
-            depth += 1
+def _identifierfunc_sql(self: "CustomDuckDBGenerator", expression: IdentifierFunc) -> str:
+    """
+    Generate DuckDB SQL for Snowflake's IDENTIFIER() function.
 
-            # Check if we're in a CREATE statement
-            if isinstance(current, exp.Create):
-                return True
+    For DuckDB, converts IDENTIFIER('literal') to a plain identifier.
+    For non-literals, falls back to function call syntax (which may error).
+    """
+    # For DuckDB, convert IDENTIFIER('literal') to identifier if possible
+    if isinstance(expression.this, exp.Literal) and expression.this.is_string:
+        # Convert string literal to unquoted identifier
+        return self._literal_identifier_sql(expression.this.this)
 
-            # Check if we're in a column definition with a default
-            if isinstance(current, exp.ColumnDef):
-                return True
+    # For non-literals (variables, expressions), fallback to function call
+    # This may error in DuckDB, which is appropriate since IDENTIFIER()
+    # is not natively supported. Its single argument is rendered directly, as in the Snowflake generator.
+    return f"IDENTIFIER({self.sql(expression, 'this')})"
 
-        return False
 
-    def identifierfunc_sql(self, expression: IdentifierFunc) -> str:
+class CustomDuckDBGenerator(DuckDB.Generator):
+    """Extended DuckDB SQL generator that knows how to handle Snowflake functions."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the generator with no statement context yet."""
+        super().__init__(*args, **kwargs)
+        self._in_create_statement = False
+        # Number of column definitions enclosing the node being generated
+        self._column_def_depth = 0
+        # Names of the Snowflake-specific rewrites applied to the last generated statement
+        self.applied_transformations: set[str] = set()
+
+    def preprocess(self, expression: exp.Expression) -> exp.Expression:
+        """Reset the per-statement context, recording once whether the statement is a CREATE."""
+        expression = super().preprocess(expression)
+        self._in_create_statement = isinstance(expression, exp.Create)
+        self._column_def_depth = 0
+        self.applied_transformations = set()
+        return expression
+
+    def _needs_parentheses_for_sysdate(self) -> bool:
         """
-        Generate DuckDB SQL for Snowflake's IDENTIFIER() function.
+        Determine if SYSDATE translation needs parentheses.
 
-        For DuckDB, converts IDENTIFIER('literal') to a plain identifier.
-        For non-literals, falls back to function call syntax (which may error).
+        We need parentheses in CREATE TABLE DEFAULT clauses where
+        complex expressions like 'AT TIME ZONE' need to be wrapped.
+        The generator tracks the column definitions it is inside, so
+        the AST's parent chain is never walked.
         """
-        # For DuckDB, convert IDENTIFIER('literal') to identifier if possible
-        if isinstance(expression.this, exp.Literal) and expression.this.is_string:
-            # Convert string literal to unquoted identifier
-            return str(exp.to_identifier(expression.this.this).sql(dialect=self.dialect))
+        return self._column_def_depth > 0
 
-        # For non-literals (variables, expressions), fallback to function call
-        # This may error in DuckDB, which is appropriate since IDENTIFIER()
-        # is not natively supported
-        return self.function_fallback_sql(expression)
+    def columndef_sql(self, expression: exp.ColumnDef, sep: str = " ") -> str:
+        """Generate a column definition, recording that SYSDATE defaults inside it need parentheses."""
+        self._column_def_depth += 1
+        try:
+            return super().columndef_sql(expression, sep)
+        finally:
+            self._column_def_depth -= 1
 
     def anonymous_sql(self, expression: exp.Anonymous) -> str:
         """
@@ -92,16 +113,23 @@ class CustomDuckDBGenerator(DuckDB.Generator):
             arg = args[0]
             # If it's a string literal, convert to unquoted identifier
             if isinstance(arg, exp.Literal) and arg.is_string:
-                return str(exp.to_identifier(arg.this).sql(dialect=self.dialect))
+                return self._literal_identifier_sql(arg.this)
 
         # Fallback for non-literals or no args
         return super().anonymous_sql(expression)
 
-    # Register the custom transformation
-    TRANSFORMS = {
-        **DuckDB.Generator.TRANSFORMS,
-        Sysdate: sysdate_sql,
-        IdentifierFunc: identifierfunc_sql,
+    def _literal_identifier_sql(self, name: str) -> str:
+        """Render an IDENTIFIER() string literal as a DuckDB identifier."""
+        # Plain, non-reserved names come out unchanged, so skip building and generating an Identifier node
+        if not self.identify and _PLAIN_IDENTIFIER_RE.match(name) and name.lower() not in self.RESERVED_KEYWORDS:
+            return name
+        return str(exp.to_identifier(name).sql(dialect=self.dialect))
+
+    # Register the custom transformations on a new dict, leaving DuckDB's own TRANSFORMS untouched.
+    # It stays a plain dict: sqlglot's generator metaclass pops unsupported entries from it.
+    TRANSFORMS = DuckDB.Generator.TRANSFORMS | {
+        Sysdate: _sysdate_sql,
+        IdentifierFunc: _identifierfunc_sql,
         exp.Anonymous: anonymous_sql,
     }
 
@@ -114,10 +142,8 @@ class CustomDuckDB(DuckDB):
     DuckDB SQL for Snowflake functions like SYSDATE().
     """
 
-    class Generator(CustomDuckDBGenerator):
-        """Generator for custom DuckDB dialect."""
-
-        pass
+    # Use the custom generator itself rather than an empty subclass of it
+    Generator = CustomDuckDBGenerator
 
 
 # Convenience function for dialect registration
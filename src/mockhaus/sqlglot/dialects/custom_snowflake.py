@@ -4,6 +4,7 @@ from typing import Any
 
 from sqlglot import expressions as exp
 from sqlglot.dialects.snowflake import Snowflake
+from sqlglot.helper import seq_get
 
 from .expressions import IdentifierFunc, Sysdate
 
@@ -28,39 +29,34 @@ def _build_identifier_func(args: list) -> exp.Expression:
     Returns:
         IdentifierFunc expression with the argument
     """
-    from sqlglot.helper import seq_get
-
     return IdentifierFunc(this=seq_get(args, 0))
 
 
 class CustomSnowflakeParser(Snowflake.Parser):
     """Extended Snowflake parser with custom functions."""
 
-    # Extend the FUNCTIONS dictionary with custom functions
-    FUNCTIONS = {
-        **Snowflake.Parser.FUNCTIONS,
+    # Extend Snowflake's FUNCTIONS on a new dict, built once when the class is created
+    FUNCTIONS = Snowflake.Parser.FUNCTIONS | {
         "SYSDATE": _parse_sysdate,
         "IDENTIFIER": _build_identifier_func,
     }
 
 
-class CustomSnowflakeGenerator(Snowflake.Generator):
-    """Extended Snowflake SQL generator with custom function support."""
+def _identifierfunc_sql(self: Snowflake.Generator, expression: IdentifierFunc) -> str:
+    """Generate SQL for IDENTIFIER() function in Snowflake dialect."""
+    # For Snowflake, always keep as IDENTIFIER() function; it has a single argument, so
+    # render it directly instead of through the generic function_fallback_sql
+    return f"IDENTIFIER({self.sql(expression, 'this')})"
 
-    def sysdate_sql(self, _: Sysdate) -> str:
-        """Generate SQL for SYSDATE() function in Snowflake dialect."""
-        return "SYSDATE()"
 
-    def identifierfunc_sql(self, expression: IdentifierFunc) -> str:
-        """Generate SQL for IDENTIFIER() function in Snowflake dialect."""
-        # For Snowflake, always keep as IDENTIFIER() function
-        return self.function_fallback_sql(expression)
+class CustomSnowflakeGenerator(Snowflake.Generator):
+    """Extended Snowflake SQL generator with custom function support."""
 
-    # Register custom SQL generators
-    TRANSFORMS = {
-        **Snowflake.Generator.TRANSFORMS,
-        Sysdate: sysdate_sql,
-        IdentifierFunc: identifierfunc_sql,
+    # Register custom SQL generators on a new dict; like CustomDuckDBGenerator's it stays a plain
+    # dict because sqlglot's generator metaclass pops unsupported entries from it.
+    TRANSFORMS = Snowflake.Generator.TRANSFORMS | {
+        Sysdate: lambda *_: "SYSDATE()",
+        IdentifierFunc: _identifierfunc_sql,
     }
 
 
@@ -73,15 +69,9 @@ class CustomSnowflake(Snowflake):
     SYSDATE().
     """
 
-    class Parser(CustomSnowflakeParser):
-        """Parser for custom Snowflake dialect."""
-
-        pass
-
-    class Generator(CustomSnowflakeGenerator):
-        """Generator for custom Snowflake dialect."""
-
-        pass
+    # Use the custom parser and generator themselves rather than empty subclasses of them
+    Parser = CustomSnowflakeParser
+    Generator = CustomSnowflakeGenerator
 
 
 # Convenience function for dialect registration
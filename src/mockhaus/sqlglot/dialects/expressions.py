@@ -18,7 +18,6 @@ class Sysdate(exp.Func):
     """
 
     arg_types = {}  # No arguments
-    is_var_len_args = False
 
 
 class IdentifierFunc(exp.Func):
@@ -10,14 +10,24 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
+def setup_test_environment(tmp_path_factory):
     """Set up the test environment."""
     # Ensure we're using the test environment
     import os
 
     os.environ.setdefault("MOCKHAUS_ENV", "test")
 
-    yield
+    # Under pytest-xdist, give each worker its own home so stage files under ~/.mockhaus never collide
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        if os.environ.get("PYTEST_XDIST_WORKER"):
+            from mockhaus.snowflake.stages import _default_stage_paths
+
+            home = str(tmp_path_factory.mktemp("home"))
+            monkeypatch.setenv("HOME", home)
+            monkeypatch.setenv("USERPROFILE", home)
+            _default_stage_paths.cache_clear()
+
+        yield
 
     # Cleanup after all tests
     pass
@@ -45,6 +55,16 @@ async def reset_state():
         pass
 
 
+def pytest_addoption(parser):
+    """Register command line options shared by the test suites."""
+    parser.addoption(
+        "--fast-load",
+        action="store_true",
+        default=False,
+        help="Load E2E CSV data with DuckDB read_csv_auto instead of STAGE + COPY INTO",
+    )
+
+
 # Add pytest markers for different test types
 def pytest_configure(config):
     """Configure pytest with custom markers."""
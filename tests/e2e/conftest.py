@@ -127,6 +127,22 @@ class SQLWorkflowExecutor:
 
         return result
 
+    def execute_sql_script(self, sql_content: str, step_name: str) -> dict[str, Any]:
+        """Execute a semicolon-separated script, stopping at the first failing statement."""
+        results = []
+        for i, statement in enumerate(self._split_sql_statements(sql_content)):
+            result = self.execute_sql_step(statement, f"{step_name} ({i + 1})")
+            results.append(result)
+            if not result.get("success", False):
+                return {"success": False, "error": result.get("error"), "results": results}
+
+        return {"success": True, "error": None, "results": results}
+
+    def bulk_load(self, csv_path: Path, table: str, step_name: str) -> dict[str, Any]:
+        """Load a headered CSV file straight into a table with DuckDB, skipping stage and COPY INTO translation."""
+        sql = f"INSERT INTO {table} SELECT * FROM read_csv_auto('{csv_path.as_posix()}', header = true)"
+        return self.execute_sql_step(sql, step_name)
+
     def get_execution_summary(self) -> dict[str, Any]:
         """Get a summary of all executed steps."""
         total_steps = len(self.execution_log)
@@ -138,15 +154,11 @@ class SQLWorkflowExecutor:
     def _split_sql_statements(self, sql_content: str) -> list[str]:
         """Split SQL content into individual statements."""
         # Remove comments and empty lines
-        lines = []
-        for line in sql_content.split("\n"):
-            line = line.strip()
-            if line and not line.startswith("--"):
-                lines.append(line)
+        lines = (line.strip() for line in sql_content.splitlines())
+        full_sql = " ".join(line for line in lines if line and not line.startswith("--"))
 
-        # Join lines and split by semicolon
-        full_sql = " ".join(lines)
-        return [stmt.strip() for stmt in full_sql.split(";") if stmt.strip()]
+        # Split by semicolon, stripping each statement once
+        return [stmt for stmt in map(str.strip, full_sql.split(";")) if stmt]
 
 
 class DataValidator:
@@ -190,6 +202,16 @@ class DataValidator:
 
         return result["data"]
 
+    def get_aggregates(self, table: str, aggregates: dict[str, str]) -> dict[str, Any]:
+        """Compute several aggregate expressions over a table in one query, keyed by alias."""
+        select_list = ", ".join(f"{expression} AS {alias}" for alias, expression in aggregates.items())
+        result = self.client.execute_query(f"SELECT {select_list} FROM {table}", self.session_id)
+
+        if not result.get("success", False):
+            raise ValueError(f"Failed to query table {table}: {result.get('error')}")
+
+        return result["data"][0]
+
     def validate_data_integrity(self, table: str, constraints: dict[str, Any]) -> bool:
         """Validate data integrity constraints."""
         try:
@@ -216,6 +238,12 @@ def e2e_client() -> Generator[E2EClient, None, None]:
         client.cleanup_all_sessions()
 
 
+@pytest.fixture(scope="session")
+def fast_load(request: pytest.FixtureRequest) -> bool:
+    """Whether pipeline tests should bulk load CSVs directly instead of going through STAGE + COPY INTO."""
+    return request.config.getoption("--fast-load")
+
+
 @pytest.fixture(scope="function")
 def temp_stage_files() -> Generator[tuple[Path, Path], None, None]:
     """Create temporary CSV files for staging operations."""
@@ -7,8 +7,11 @@ This test validates the complete Mockhaus data pipeline workflow including:
 - Data integrity validation throughout the process
 """
 
+import logging
+import shutil
 import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -17,81 +20,119 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from tests.e2e.conftest import DataValidator, E2EClient, SQLWorkflowExecutor
 
+logger = logging.getLogger(__name__)
+
+_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "data_pipeline"
+
+# Upsert staged customers into the final table; both pipeline phases run this same statement
+_MERGE_CUSTOMERS_SQL = """
+MERGE INTO customer_final AS target
+USING customer_staging AS source
+ON target.customer_id = source.customer_id
+WHEN MATCHED THEN
+    UPDATE SET
+        name = source.name,
+        email = source.email,
+        status = source.status,
+        last_updated = source.last_updated,
+        version = target.version + 1
+WHEN NOT MATCHED THEN
+    INSERT (customer_id, name, email, signup_date, status, last_updated, version)
+    VALUES (source.customer_id, source.name, source.email, source.signup_date, source.status, source.last_updated, 1)
+"""
+
+
+@pytest.fixture(scope="class")
+def pipeline_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Copy the pipeline CSV files once into a directory shared by every test in the class."""
+    stage_dir = tmp_path_factory.mktemp("data_pipeline")
+    for file_name in ("customer_initial_data.csv", "customer_incremental_data.csv"):
+        shutil.copy2(_FIXTURES_DIR / file_name, stage_dir / file_name)
+    return stage_dir
+
 
 @pytest.mark.e2e
 @pytest.mark.data_pipeline
 class TestDataPipelineMergeWorkflow:
     """Test complete data pipeline workflow with MERGE operations."""
 
-    def test_data_pipeline_merge_workflow(self, e2e_client: E2EClient, temp_stage_files) -> None:
+    @pytest.fixture
+    def pipeline_session(self, e2e_client: E2EClient, pipeline_workspace: Path) -> tuple[str, SQLWorkflowExecutor, Path]:
+        """Create a session with the file format, stage and tables set up over the shared workspace."""
+        session = e2e_client.create_session(type="memory", ttl_seconds=3600)
+        session_id = session["session_id"]
+        executor = SQLWorkflowExecutor(e2e_client, session_id)
+
+        # Phases 1 and 2: Setup file formats, stages and tables as a single script
+        logger.debug("--- Phases 1-2: Setting up file format, stage and tables ---")
+        result = executor.execute_sql_script(self._pipeline_setup_script(pipeline_workspace), "Set up pipeline schema")
+        assert result["success"], f"Failed to set up pipeline schema: {result.get('error')}"
+        logger.debug("✓ File format, stage (pointing to %s) and tables created successfully", pipeline_workspace)
+
+        return session_id, executor, pipeline_workspace
+
+    def test_data_pipeline_merge_workflow(self, pipeline_session: tuple[str, SQLWorkflowExecutor, Path], fast_load: bool) -> None:
         """
         Test the complete data pipeline MERGE workflow.
 
         This test executes a comprehensive workflow that includes:
-        1. Creating file formats and stages
-        2. Setting up staging and final tables
+        1. Creating file formats and stages (see pipeline_session)
+        2. Setting up staging and final tables (see pipeline_session)
         3. Loading initial data via COPY INTO
         4. Executing first MERGE (all inserts)
         5. Loading incremental data
         6. Executing second MERGE (updates + inserts)
         7. Validating all data transformations
+
+        With --fast-load, steps 3 and 5 read the CSVs directly with DuckDB instead of COPY INTO.
         """
-        # Setup: Create session and prepare file paths
-        session = e2e_client.create_session(type="memory", ttl_seconds=3600)
-        session_id = session["session_id"]
+        # Setup: Use the prepared session and stage directory
+        session_id, executor, stage_dir = pipeline_session
 
-        initial_file, incremental_file = temp_stage_files
+        initial_file = stage_dir / "customer_initial_data.csv"
+        incremental_file = stage_dir / "customer_incremental_data.csv"
 
         # Initialize utilities
-        executor = SQLWorkflowExecutor(e2e_client, session_id)
-        validator = DataValidator(e2e_client, session_id)
+        validator = DataValidator(executor.client, session_id)
 
-        print("\n=== Starting Data Pipeline MERGE Workflow Test ===")
-        print(f"Session ID: {session_id}")
-        print(f"Initial data file: {initial_file}")
-        print(f"Incremental data file: {incremental_file}")
+        logger.debug("=== Starting Data Pipeline MERGE Workflow Test ===")
+        logger.debug("Session ID: %s", session_id)
+        logger.debug("Initial data file: %s", initial_file)
+        logger.debug("Incremental data file: %s", incremental_file)
 
         try:
-            # Phase 1: Setup file formats and stages
-            temp_files_dir = initial_file.parent
-            self._setup_file_format_and_stage(executor, temp_files_dir)
-
-            # Phase 2: Create tables
-            self._create_tables(executor)
-
             # Phase 3: Execute initial data pipeline
-            self._execute_initial_data_pipeline(executor, validator, initial_file)
+            self._execute_initial_data_pipeline(executor, validator, initial_file, fast_load)
 
             # Phase 4: Execute incremental data pipeline
-            self._execute_incremental_data_pipeline(executor, validator, incremental_file)
+            self._execute_incremental_data_pipeline(executor, validator, incremental_file, fast_load)
 
             # Phase 5: Final validation
             self._validate_final_results(validator)
 
-            print("\n=== Data Pipeline MERGE Workflow Test PASSED ===")
+            logger.debug("=== Data Pipeline MERGE Workflow Test PASSED ===")
 
         except Exception:
-            # Print execution summary for debugging
+            # Log execution summary for debugging
             summary = executor.get_execution_summary()
-            print("\n=== Test FAILED - Execution Summary ===")
-            print(f"Total steps: {summary['total_steps']}")
-            print(f"Successful steps: {summary['successful_steps']}")
-            print(f"Failed steps: {summary['failed_steps']}")
+            logger.error("=== Test FAILED - Execution Summary ===")
+            logger.error("Total steps: %s", summary["total_steps"])
+            logger.error("Successful steps: %s", summary["successful_steps"])
+            logger.error("Failed steps: %s", summary["failed_steps"])
 
-            # Print last few steps for debugging
+            # Log last few steps for debugging
             if summary["execution_log"]:
-                print("\nLast execution steps:")
+                logger.error("Last execution steps:")
                 for step in summary["execution_log"][-3:]:
-                    print(f"  {step.get('step_name', 'Unknown')}: {step.get('success', False)}")
+                    logger.error("  %s: %s", step.get("step_name", "Unknown"), step.get("success", False))
                     if not step.get("success", False):
-                        print(f"    Error: {step.get('error', 'Unknown error')}")
+                        logger.error("    Error: %s", step.get("error", "Unknown error"))
 
             raise
 
-    def _setup_file_format_and_stage(self, executor: SQLWorkflowExecutor, temp_files_dir: Path) -> None:
-        """Set up file format and stage for data ingestion."""
-        print("\n--- Phase 1: Setting up file format and stage ---")
-
+    @staticmethod
+    def _pipeline_setup_script(temp_files_dir: Path) -> str:
+        """Build the DDL script creating the file format, stage, and staging and final tables."""
         # Create CSV file format
         format_sql = """
         CREATE FILE FORMAT csv_customer_format
@@ -103,10 +144,6 @@ class TestDataPipelineMergeWorkflow:
         ERROR_ON_COLUMN_COUNT_MISMATCH = FALSE
         """
 
-        result = executor.execute_sql_step(format_sql, "Create CSV file format")
-        assert result["success"], f"Failed to create file format: {result.get('error')}"
-        print("✓ CSV file format created successfully")
-
         # Create external stage pointing to temp directory
         stage_sql = f"""
         CREATE STAGE customer_data_stage
@@ -114,14 +151,6 @@ class TestDataPipelineMergeWorkflow:
         FILE_FORMAT = csv_customer_format
         """
 
-        result = executor.execute_sql_step(stage_sql, "Create data stage")
-        assert result["success"], f"Failed to create stage: {result.get('error')}"
-        print(f"✓ External stage created successfully (pointing to {temp_files_dir})")
-
-    def _create_tables(self, executor: SQLWorkflowExecutor) -> None:
-        """Create staging and final tables."""
-        print("\n--- Phase 2: Creating tables ---")
-
         # Create final target table
         final_table_sql = """
         CREATE TABLE customer_final (
@@ -135,13 +164,9 @@ class TestDataPipelineMergeWorkflow:
         )
         """
 
-        result = executor.execute_sql_step(final_table_sql, "Create final table")
-        assert result["success"], f"Failed to create final table: {result.get('error')}"
-        print("✓ Final table created successfully")
-
-        # Create staging table
+        # Create staging table; it is only a scratch buffer between COPY INTO and MERGE, so make it temporary
         staging_table_sql = """
-        CREATE TABLE customer_staging (
+        CREATE TEMPORARY TABLE customer_staging (
             customer_id INTEGER,
             name VARCHAR(100),
             email VARCHAR(100),
@@ -151,167 +176,111 @@ class TestDataPipelineMergeWorkflow:
         )
         """
 
-        result = executor.execute_sql_step(staging_table_sql, "Create staging table")
-        assert result["success"], f"Failed to create staging table: {result.get('error')}"
-        print("✓ Staging table created successfully")
+        return ";\n".join([format_sql, stage_sql, final_table_sql, staging_table_sql])
 
-    def _execute_initial_data_pipeline(self, executor: SQLWorkflowExecutor, validator: DataValidator, initial_file: Path) -> None:  # noqa: ARG002
-        """Execute the initial data load and merge."""
-        print("\n--- Phase 3: Initial data pipeline ---")
+    @staticmethod
+    def _load_staging(executor: SQLWorkflowExecutor, data_file: Path, step_name: str, fast_load: bool) -> dict[str, Any]:
+        """Load a CSV file into the staging table, via the stage and COPY INTO unless fast loading."""
+        if fast_load:
+            return executor.bulk_load(data_file, "customer_staging", step_name)
 
-        # Load initial data into staging
-        copy_sql = """
+        copy_sql = f"""
         COPY INTO customer_staging
-        FROM '@customer_data_stage/customer_initial_data.csv'
+        FROM '@customer_data_stage/{data_file.name}'
         FILE_FORMAT = csv_customer_format
         """
+        return executor.execute_sql_step(copy_sql, step_name)
+
+    def _execute_initial_data_pipeline(self, executor: SQLWorkflowExecutor, validator: DataValidator, initial_file: Path, fast_load: bool) -> None:
+        """Execute the initial data load and merge."""
+        logger.debug("--- Phase 3: Initial data pipeline ---")
 
-        result = executor.execute_sql_step(copy_sql, "Load initial data to staging")
+        # Load initial data into staging
+        result = self._load_staging(executor, initial_file, "Load initial data to staging", fast_load)
         assert result["success"], f"Failed to load initial data: {result.get('error')}"
-        print("✓ Initial data loaded to staging")
+        logger.debug("✓ Initial data loaded to staging")
 
         # Validate staging data count
         staging_count = validator.get_record_count("customer_staging")
         assert staging_count == 3, f"Expected 3 records in staging, got {staging_count}"
-        print(f"✓ Staging table has {staging_count} records")
+        logger.debug("✓ Staging table has %s records", staging_count)
 
         # Execute first MERGE operation
-        merge_sql = """
-        MERGE INTO customer_final AS target
-        USING customer_staging AS source
-        ON target.customer_id = source.customer_id
-        WHEN MATCHED THEN
-            UPDATE SET
-                name = source.name,
-                email = source.email,
-                status = source.status,
-                last_updated = source.last_updated,
-                version = target.version + 1
-        WHEN NOT MATCHED THEN
-            INSERT (customer_id, name, email, signup_date, status, last_updated, version)
-            VALUES (source.customer_id, source.name, source.email, source.signup_date, source.status, source.last_updated, 1)
-        """
+        merge_sql = _MERGE_CUSTOMERS_SQL
 
         result = executor.execute_sql_step(merge_sql, "Execute first MERGE")
         assert result["success"], f"Failed to execute first MERGE: {result.get('error')}"
-        print("✓ First MERGE operation completed")
+        logger.debug("✓ First MERGE operation completed")
 
         # Validate final table after first merge
         final_count = validator.get_record_count("customer_final")
         assert final_count == 3, f"Expected 3 records in final table, got {final_count}"
-        print(f"✓ Final table has {final_count} records after first MERGE")
+        logger.debug("✓ Final table has %s records after first MERGE", final_count)
 
         # Clear staging table
-        clear_sql = "DELETE FROM customer_staging"
+        clear_sql = "TRUNCATE TABLE customer_staging"
         result = executor.execute_sql_step(clear_sql, "Clear staging table")
         assert result["success"], f"Failed to clear staging table: {result.get('error')}"
-        print("✓ Staging table cleared")
+        logger.debug("✓ Staging table cleared")
 
-    def _execute_incremental_data_pipeline(self, executor: SQLWorkflowExecutor, validator: DataValidator, incremental_file: Path) -> None:  # noqa: ARG002
+    def _execute_incremental_data_pipeline(
+        self, executor: SQLWorkflowExecutor, validator: DataValidator, incremental_file: Path, fast_load: bool
+    ) -> None:
         """Execute the incremental data load and merge."""
-        print("\n--- Phase 4: Incremental data pipeline ---")
+        logger.debug("--- Phase 4: Incremental data pipeline ---")
 
         # Load incremental data into staging
-        copy_sql = """
-        COPY INTO customer_staging
-        FROM '@customer_data_stage/customer_incremental_data.csv'
-        FILE_FORMAT = csv_customer_format
-        """
-
-        result = executor.execute_sql_step(copy_sql, "Load incremental data to staging")
+        result = self._load_staging(executor, incremental_file, "Load incremental data to staging", fast_load)
         assert result["success"], f"Failed to load incremental data: {result.get('error')}"
-        print("✓ Incremental data loaded to staging")
+        logger.debug("✓ Incremental data loaded to staging")
 
         # Validate staging data count
         staging_count = validator.get_record_count("customer_staging")
         assert staging_count == 3, f"Expected 3 records in staging, got {staging_count}"
-        print(f"✓ Staging table has {staging_count} records")
+        logger.debug("✓ Staging table has %s records", staging_count)
 
         # Execute second MERGE operation (updates + inserts)
-        merge_sql = """
-        MERGE INTO customer_final AS target
-        USING customer_staging AS source
-        ON target.customer_id = source.customer_id
-        WHEN MATCHED THEN
-            UPDATE SET
-                name = source.name,
-                email = source.email,
-                status = source.status,
-                last_updated = source.last_updated,
-                version = target.version + 1
-        WHEN NOT MATCHED THEN
-            INSERT (customer_id, name, email, signup_date, status, last_updated, version)
-            VALUES (source.customer_id, source.name, source.email, source.signup_date, source.status, source.last_updated, 1)
-        """
+        merge_sql = _MERGE_CUSTOMERS_SQL
 
         result = executor.execute_sql_step(merge_sql, "Execute second MERGE")
         assert result["success"], f"Failed to execute second MERGE: {result.get('error')}"
-        print("✓ Second MERGE operation completed")
+        logger.debug("✓ Second MERGE operation completed")
 
         # Validate final table after second merge
         final_count = validator.get_record_count("customer_final")
         assert final_count == 4, f"Expected 4 records in final table, got {final_count}"
-        print(f"✓ Final table has {final_count} records after second MERGE")
+        logger.debug("✓ Final table has %s records after second MERGE", final_count)
 
     def _validate_final_results(self, validator: DataValidator) -> None:
         """Perform comprehensive validation of final results."""
-        print("\n--- Phase 5: Final validation ---")
-
-        # Get all final data for detailed validation
-        final_data = validator.get_table_data("customer_final", "customer_id")
-
-        # Validate total record count
-        assert len(final_data) == 4, f"Expected 4 final records, got {len(final_data)}"
-        print("✓ Final record count is correct (4 records)")
-
-        # Create lookup for easier validation
-        customers = {row["customer_id"]: row for row in final_data}
-
-        # Validate customer 1001 (unchanged from initial load)
-        customer_1001 = customers[1001]
-        assert customer_1001["name"] == "John Doe"
-        assert customer_1001["email"] == "john@example.com"
-        assert customer_1001["status"] == "active"
-        assert customer_1001["version"] == 1  # Should not be updated
-        print("✓ Customer 1001 validation passed (unchanged)")
-
-        # Validate customer 1002 (updated in incremental)
-        customer_1002 = customers[1002]
-        assert customer_1002["name"] == "Jane Smith Updated"
-        assert customer_1002["email"] == "jane.smith@example.com"
-        assert customer_1002["status"] == "active"
-        assert customer_1002["version"] == 2  # Should be updated
-        print("✓ Customer 1002 validation passed (updated)")
-
-        # Validate customer 1003 (status updated from pending to active)
-        customer_1003 = customers[1003]
-        assert customer_1003["name"] == "Bob Johnson"
-        assert customer_1003["email"] == "bob@example.com"
-        assert customer_1003["status"] == "active"  # Changed from pending
-        assert customer_1003["version"] == 2  # Should be updated
-        print("✓ Customer 1003 validation passed (status updated)")
-
-        # Validate customer 1004 (new insert)
-        customer_1004 = customers[1004]
-        assert customer_1004["name"] == "Alice Wilson"
-        assert customer_1004["email"] == "alice@example.com"
-        assert customer_1004["status"] == "active"
-        assert customer_1004["version"] == 1  # New record
-        print("✓ Customer 1004 validation passed (new insert)")
-
-        # Validate version distribution
-        version_1_count = sum(1 for c in final_data if c["version"] == 1)
-        version_2_count = sum(1 for c in final_data if c["version"] == 2)
-
-        assert version_1_count == 2, f"Expected 2 records with version 1, got {version_1_count}"
-        assert version_2_count == 2, f"Expected 2 records with version 2, got {version_2_count}"
-        print("✓ Version tracking validation passed")
-
-        print("\n=== All validations passed successfully! ===")
+        logger.debug("--- Phase 5: Final validation ---")
+
+        # Expected (name, email, version) per customer; every customer ends up active
+        expected_customers = {
+            1001: ("John Doe", "john@example.com", 1),  # Unchanged from initial load
+            1002: ("Jane Smith Updated", "jane.smith@example.com", 2),  # Updated in incremental
+            1003: ("Bob Johnson", "bob@example.com", 2),  # Status updated from pending to active
+            1004: ("Alice Wilson", "alice@example.com", 1),  # New insert
+        }
+
+        # Compute every invariant in one aggregate query instead of fetching and checking rows in Python
+        aggregates = {"total_records": "COUNT(*)", "version_1_records": "COUNT_IF(version = 1)", "version_2_records": "COUNT_IF(version = 2)"}
+        for customer_id, (name, email, version) in expected_customers.items():
+            aggregates[f"customer_{customer_id}"] = (
+                f"COUNT_IF(customer_id = {customer_id} AND name = '{name}' AND email = '{email}' AND status = 'active' AND version = {version})"
+            )
+        checks = validator.get_aggregates("customer_final", aggregates)
+
+        expected_checks = {"total_records": 4, "version_1_records": 2, "version_2_records": 2}
+        expected_checks.update({f"customer_{customer_id}": 1 for customer_id in expected_customers})
+        assert checks == expected_checks, f"Final table validation failed: {checks}"
+        logger.debug("✓ Record count, per-customer values and version tracking validation passed")
+
+        logger.debug("=== All validations passed successfully! ===")
 
     def test_session_isolation_during_workflow(self, e2e_client: E2EClient) -> None:
         """Test that workflow executions are properly isolated between sessions."""
-        print("\n=== Testing Session Isolation ===")
+        logger.debug("=== Testing Session Isolation ===")
 
         # Create two separate sessions
         session1 = e2e_client.create_session(type="memory")
@@ -346,11 +315,11 @@ class TestDataPipelineMergeWorkflow:
         assert len(result1["data"]) == 1
         assert result1["data"][0]["session_name"] == "session1"
 
-        print("✓ Session isolation working correctly")
+        logger.debug("✓ Session isolation working correctly")
 
     def test_error_handling_in_workflow(self, e2e_client: E2EClient) -> None:
         """Test error handling during workflow execution."""
-        print("\n=== Testing Error Handling ===")
+        logger.debug("=== Testing Error Handling ===")
 
         session = e2e_client.create_session(type="memory")
         session_id = session["session_id"]
@@ -363,11 +332,11 @@ class TestDataPipelineMergeWorkflow:
 
         assert not result["success"], "Invalid SQL should fail"
         assert "error" in result
-        print("✓ Error handling working correctly")
+        logger.debug("✓ Error handling working correctly")
 
         # Verify session is still functional after error
         valid_sql = "SELECT 1 as test"
         result = executor.execute_sql_step(valid_sql, "Recovery test")
 
         assert result["success"], "Session should recover after error"
-        print("✓ Session recovery after error working correctly")
+        logger.debug("✓ Session recovery after error working correctly")
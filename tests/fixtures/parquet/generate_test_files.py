@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Generate test PARQUET files with different compression formats for integration testing."""
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-import pandas as pd  # type: ignore[import-untyped]
 import pyarrow as pa  # type: ignore[import-untyped]
 import pyarrow.parquet as pq  # type: ignore[import-untyped]
 
@@ -18,7 +20,17 @@ def create_test_data():
         "is_active": [True, True, False, True, True],
         "department": ["Engineering", "Sales", "Marketing", "Engineering", "Sales"],
     }
-    return pd.DataFrame(data)
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("name", pa.string()),
+            ("age", pa.int64()),
+            ("salary", pa.float64()),
+            ("is_active", pa.bool_()),
+            ("department", pa.string()),
+        ]
+    )
+    return pa.table(data, schema=schema)
 
 
 def create_test_data_with_nulls():
@@ -30,7 +42,8 @@ def create_test_data_with_nulls():
         "salary": [50000.0, None, 75000.0, 55000.0, 65000.0],
         "is_active": [True, None, False, True, None],
     }
-    return pd.DataFrame(data)
+    schema = pa.schema([("id", pa.int64()), ("name", pa.string()), ("age", pa.int64()), ("salary", pa.float64()), ("is_active", pa.bool_())])
+    return pa.table(data, schema=schema)
 
 
 def create_test_data_with_binary():
@@ -41,15 +54,47 @@ def create_test_data_with_binary():
         "binary_data": [b"binary1", b"binary2", b"binary3"],
         "text_data": ["text1", "text2", "text3"],
     }
-    return pd.DataFrame(data)
+    schema = pa.schema([("id", pa.int64()), ("name", pa.string()), ("binary_data", pa.binary()), ("text_data", pa.string())])
+    return pa.table(data, schema=schema)
 
 
-def generate_parquet_files():
-    """Generate PARQUET files with different compression formats."""
-    output_dir = Path(__file__).parent
+def _write_one(dataset_name, table, comp_name, comp_type, output_dir):
+    """Write one dataset with one compression and return the file name; failures are raised naming the file."""
+    filename = f"{dataset_name}_{comp_name}.parquet"
+    filepath = output_dir / filename
+
+    try:
+        # Write PARQUET file with specified compression
+        pq.write_table(
+            table,
+            filepath,
+            compression=comp_type,
+            use_dictionary=True,  # Enable dictionary encoding
+            row_group_size=3,  # Small row groups for testing
+            write_statistics=True,  # Include statistics
+        )
+
+        # write_table raises on failure; re-reading the footer is only worth it when debugging the generator
+        if os.environ.get("PARQUET_FIXTURES_VERIFY"):
+            pq.ParquetFile(filepath)
+    except Exception as e:
+        raise RuntimeError(f"Failed to write {filename}: {e}") from e
+
+    return filename
+
+
+def _is_up_to_date(filepath, script_mtime):
+    """Check whether a generated file exists and is newer than this script, so regenerating it would change nothing."""
+    return filepath.exists() and filepath.stat().st_mtime > script_mtime
+
+
+def generate_parquet_files(output_dir=None, force=False):
+    """Generate PARQUET files with different compression formats, skipping files newer than this script unless forced."""
+    output_dir = Path(__file__).parent if output_dir is None else Path(output_dir)
+    script_mtime = Path(__file__).stat().st_mtime
 
-    # Test data sets
-    datasets = {"basic": create_test_data(), "with_nulls": create_test_data_with_nulls(), "with_binary": create_test_data_with_binary()}
+    # Test data sets, built directly as PyArrow tables
+    tables = {"basic": create_test_data(), "with_nulls": create_test_data_with_nulls(), "with_binary": create_test_data_with_binary()}
 
     # Compression formats supported by both PyArrow and DuckDB
     compressions = {
@@ -61,37 +106,29 @@ def generate_parquet_files():
         "zstd": "zstd",  # ZSTD compression (if available)
     }
 
-    generated_files = []
-
-    for dataset_name, df in datasets.items():
+    # Output is deterministic, so only files older than this script (or missing) need writing
+    filenames = []
+    pending = []
+    for dataset_name in tables:
         for comp_name, comp_type in compressions.items():
-            try:
-                filename = f"{dataset_name}_{comp_name}.parquet"
-                filepath = output_dir / filename
-
-                # Convert to PyArrow table for more control
-                table = pa.Table.from_pandas(df)
-
-                # Write PARQUET file with specified compression
-                pq.write_table(
-                    table,
-                    filepath,
-                    compression=comp_type,
-                    use_dictionary=True,  # Enable dictionary encoding
-                    row_group_size=3,  # Small row groups for testing
-                    write_statistics=True,  # Include statistics
-                )
-
-                generated_files.append(filename)
-
-                # Verify file was created successfully
-                pq.ParquetFile(filepath)  # Just verify it's readable
-
-            except Exception:
-                # Generation failed - continue with other files
-                pass
-
-    return generated_files
+            filename = f"{dataset_name}_{comp_name}.parquet"
+            filenames.append(filename)
+            if force or not _is_up_to_date(output_dir / filename, script_mtime):
+                pending.append((dataset_name, comp_name, comp_type))
+
+    # Each file is encoded independently and compression is CPU-bound, so write them in parallel processes
+    if pending:
+        with ProcessPoolExecutor() as pool:
+            futures = [
+                pool.submit(_write_one, dataset_name, tables[dataset_name], comp_name, comp_type, output_dir)
+                for dataset_name, comp_name, comp_type in pending
+            ]
+            # result() re-raises a worker's failure, so a file that could not be written stops generation
+            for future in as_completed(futures):
+                future.result()
+
+    # Report files in dataset/compression order, regardless of completion order; skipped files are already current
+    return filenames
 
 
 def create_file_info():
@@ -140,6 +177,6 @@ def create_file_info():
 
 if __name__ == "__main__":
     # Generate test PARQUET files
-    generated_files = generate_parquet_files()
+    generated_files = generate_parquet_files(force="--force" in sys.argv)
     create_file_info()
     # Files generated successfully
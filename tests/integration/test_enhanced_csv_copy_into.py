@@ -1,66 +1,81 @@
 """Integration tests for enhanced CSV COPY INTO functionality."""
 
-import csv
 import os
-import tempfile
 from pathlib import Path
 
 import duckdb
+import pyarrow as pa
+import pytest
 
 from mockhaus.snowflake.copy_into import CopyIntoTranslator
 from mockhaus.snowflake.file_formats.manager import MockFileFormatManager
 from mockhaus.snowflake.stages import MockStageManager
 
+# CSV fixture payloads, written as-is by the tests that need them
+_PIPE_DELIMITED_CSV = b"id|name|email\n1|Alice|alice@test.com\n2|Bob|bob@test.com\n"
+
+_CRLF_CSV = b"id,name\r\n1,Alice\r\n2,Bob\r\n"
+
+_NULLS_CSV = (
+    b"id,name,email\n"
+    b"1,Alice,alice@test.com\n"
+    b"2,,bob@test.com\n"  # Empty field (first NULL_IF)
+    b"3,NULL,charlie@test.com\n"  # NULL string (not first)
+    b"4,N/A,david@test.com\n"  # N/A string (not first)
+)
+
+_MISMATCH_CSV = (
+    b"id,name\n"
+    b"1,Alice\n"
+    b"2,Bob,extra_column\n"  # Extra column
+    b"3\n"  # Missing column
+)
+
+# CRLF and pipe delimiter with quoted fields
+_COMPLEX_CSV = (
+    b'id|"name"|"email"\r\n'
+    b'1|"Alice Smith"|"alice@test.com"\r\n'
+    b'2|""|"bob@test.com"\r\n'  # Empty quoted field
+    b'3|"Charlie"|"charlie@test.com"\r\n'
+)
+
 
 class TestEnhancedCSVCopyInto:
     """Test enhanced CSV functionality with COPY INTO operations."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_environment(self, tmp_path: Path):
         """Set up test fixtures."""
         self.conn = duckdb.connect(":memory:")
         self.stage_manager = MockStageManager(self.conn)
         self.format_manager = MockFileFormatManager(self.conn)
         self.translator = CopyIntoTranslator(self.stage_manager, self.format_manager)
 
-        # Create a temporary directory for test files
-        self.temp_dir = Path(tempfile.mkdtemp())
+        # Test files go in pytest's per-test directory, which is also unique per xdist worker
+        self.temp_dir = tmp_path
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        self.conn.close()
-        # Clean up temp directory
-        import shutil
+        # Every test loads from test_stage, pointing at that directory
+        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
+
+        yield
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.conn.close()
 
     def _create_test_csv(self, filename: str, data: list, encoding: str = "utf-8") -> str:
-        """Create a test CSV file with given data."""
+        """Create a test CSV file with given data; values must not need quoting."""
         file_path = os.path.join(self.temp_dir, filename)
-
-        with open(file_path, "w", newline="", encoding=encoding) as f:
-            writer = csv.writer(f)
-            writer.writerows(data)
-
+        Path(file_path).write_text("".join(",".join(map(str, row)) + "\n" for row in data), encoding=encoding)
         return file_path
 
+    def _assert_query_result(self, sql: str, expected: dict[str, list]) -> None:
+        """Fetch a query result as an Arrow table and compare it with the expected columns in one call."""
+        actual = self.conn.execute(sql).fetch_arrow_table()
+        assert actual.equals(pa.table(expected, schema=actual.schema)), actual.to_pydict()
+
     def test_enhanced_field_delimiter_copy_into(self):
         """Test COPY INTO with enhanced field delimiter support."""
         # Create test CSV with pipe delimiter
-        test_data = [
-            ["id", "name", "email"],
-            ["1", "Alice", "alice@test.com"],
-            ["2", "Bob", "bob@test.com"],
-        ]
-        csv_path = self._create_test_csv("pipe_delim.csv", test_data)
-
-        # Update CSV content to use pipe delimiter
-        with open(csv_path, "w", encoding="utf-8") as f:
-            f.write("id|name|email\n")
-            f.write("1|Alice|alice@test.com\n")
-            f.write("2|Bob|bob@test.com\n")
-
-        # Create stage pointing to temp directory
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
+        (self.temp_dir / "pipe_delim.csv").write_bytes(_PIPE_DELIMITED_CSV)
 
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR, email VARCHAR)")
@@ -77,20 +92,15 @@ class TestEnhancedCSVCopyInto:
         assert result["rows_loaded"] == 2
 
         # Verify data
-        rows = self.conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
-        assert len(rows) == 2
-        assert rows[0] == (1, "Alice", "alice@test.com")
-        assert rows[1] == (2, "Bob", "bob@test.com")
+        self._assert_query_result(
+            "SELECT * FROM test_table ORDER BY id",
+            {"id": [1, 2], "name": ["Alice", "Bob"], "email": ["alice@test.com", "bob@test.com"]},
+        )
 
     def test_record_delimiter_copy_into(self):
         """Test COPY INTO with different record delimiters."""
         # Create CSV with CRLF line endings
-        csv_path = os.path.join(self.temp_dir, "crlf_delim.csv")
-        with open(csv_path, "wb") as f:
-            f.write(b"id,name\r\n1,Alice\r\n2,Bob\r\n")
-
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
+        (self.temp_dir / "crlf_delim.csv").write_bytes(_CRLF_CSV)
 
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR)")
@@ -116,9 +126,6 @@ class TestEnhancedCSVCopyInto:
         ]
         self._create_test_csv("test.csv", test_data)
 
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
-
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR)")
 
@@ -144,9 +151,6 @@ class TestEnhancedCSVCopyInto:
         ]
         self._create_test_csv("utf8.csv", test_data, encoding="utf-8")
 
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
-
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR)")
 
@@ -162,23 +166,12 @@ class TestEnhancedCSVCopyInto:
         assert result["rows_loaded"] == 2
 
         # Verify special characters are preserved
-        rows = self.conn.execute("SELECT name FROM test_table ORDER BY id").fetchall()
-        assert rows[0][0] == "Cärlös"
-        assert rows[1][0] == "Bøb"
+        self._assert_query_result("SELECT name FROM test_table ORDER BY id", {"name": ["Cärlös", "Bøb"]})
 
     def test_null_if_first_value_copy_into(self):
         """Test COPY INTO with NULL_IF using first value only."""
         # Create CSV with various NULL representations
-        csv_path = os.path.join(self.temp_dir, "nulls.csv")
-        with open(csv_path, "w", encoding="utf-8") as f:
-            f.write("id,name,email\n")
-            f.write("1,Alice,alice@test.com\n")
-            f.write("2,,bob@test.com\n")  # Empty field (first NULL_IF)
-            f.write("3,NULL,charlie@test.com\n")  # NULL string (not first)
-            f.write("4,N/A,david@test.com\n")  # N/A string (not first)
-
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
+        (self.temp_dir / "nulls.csv").write_bytes(_NULLS_CSV)
 
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR, email VARCHAR)")
@@ -195,24 +188,16 @@ class TestEnhancedCSVCopyInto:
         assert result["rows_loaded"] == 4
 
         # Verify NULL handling (only empty string should be treated as NULL)
-        rows = self.conn.execute("SELECT id, name FROM test_table ORDER BY id").fetchall()
-        assert rows[0] == (1, "Alice")
-        assert rows[1] == (2, None)  # Empty string -> NULL
-        assert rows[2] == (3, "NULL")  # 'NULL' string preserved (not first in list)
-        assert rows[3] == (4, "N/A")  # 'N/A' string preserved (not first in list)
+        self._assert_query_result(
+            "SELECT id, name FROM test_table ORDER BY id",
+            # Empty string -> NULL; 'NULL' and 'N/A' strings preserved (not first in list)
+            {"id": [1, 2, 3, 4], "name": ["Alice", None, "NULL", "N/A"]},
+        )
 
     def test_error_handling_mapping_copy_into(self):
         """Test ERROR_ON_COLUMN_COUNT_MISMATCH mapping."""
         # Create CSV with mismatched columns
-        csv_path = os.path.join(self.temp_dir, "mismatch.csv")
-        with open(csv_path, "w", encoding="utf-8") as f:
-            f.write("id,name\n")
-            f.write("1,Alice\n")
-            f.write("2,Bob,extra_column\n")  # Extra column
-            f.write("3\n")  # Missing column
-
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
+        (self.temp_dir / "mismatch.csv").write_bytes(_MISMATCH_CSV)
 
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR)")
@@ -231,16 +216,7 @@ class TestEnhancedCSVCopyInto:
     def test_complex_csv_format_copy_into(self):
         """Test COPY INTO with complex CSV format combining multiple features."""
         # Create complex CSV with multiple features
-        csv_path = os.path.join(self.temp_dir, "complex.csv")
-        with open(csv_path, "wb") as f:
-            # Use CRLF and pipe delimiter with quoted fields
-            f.write(b'id|"name"|"email"\r\n')
-            f.write(b'1|"Alice Smith"|"alice@test.com"\r\n')
-            f.write(b'2|""|"bob@test.com"\r\n')  # Empty quoted field
-            f.write(b'3|"Charlie"|"charlie@test.com"\r\n')
-
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
+        (self.temp_dir / "complex.csv").write_bytes(_COMPLEX_CSV)
 
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR, email VARCHAR)")
@@ -266,11 +242,11 @@ class TestEnhancedCSVCopyInto:
         assert result["rows_loaded"] == 3
 
         # Verify data with proper handling of quoted fields and NULLs
-        rows = self.conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
-        assert len(rows) == 3
-        assert rows[0] == (1, "Alice Smith", "alice@test.com")
-        assert rows[1] == (2, None, "bob@test.com")  # Empty quoted field -> NULL
-        assert rows[2] == (3, "Charlie", "charlie@test.com")
+        self._assert_query_result(
+            "SELECT * FROM test_table ORDER BY id",
+            # Empty quoted field -> NULL
+            {"id": [1, 2, 3], "name": ["Alice Smith", None, "Charlie"], "email": ["alice@test.com", "bob@test.com", "charlie@test.com"]},
+        )
 
     def test_unsupported_options_with_warnings(self):
         """Test that unsupported options generate warnings but don't fail."""
@@ -281,9 +257,6 @@ class TestEnhancedCSVCopyInto:
         ]
         self._create_test_csv("simple.csv", test_data)
 
-        # Create stage
-        self.stage_manager.create_stage("test_stage", stage_type="EXTERNAL", url=f"file://{self.temp_dir.as_posix()}")
-
         # Create table
         self.conn.execute("CREATE TABLE test_table (id INT, name VARCHAR)")
 
@@ -1,6 +1,6 @@
 """
 This module contains unit tests for the Pydantic models defined in
-`src.mockhaus.server.snowflake_api.models`. These tests ensure that each model
+`mockhaus.server.snowflake_api.models`. These tests ensure that each model
 correctly validates incoming data, handles required and optional fields,
 and correctly maps field aliases.
 
@@ -13,7 +13,7 @@ The tests cover:
 
 import pytest
 from pydantic import ValidationError
-from src.mockhaus.server.snowflake_api.models import (
+from mockhaus.server.snowflake_api.models import (
     StatementStatus,
     RowType,
     PartitionInfo,
@@ -0,0 +1,39 @@
+"""Unit tests for the format handler registry."""
+
+import pytest
+
+from mockhaus.snowflake.file_formats.csv import CSVFormatHandler
+from mockhaus.snowflake.file_formats.registry import FormatHandlerRegistry
+
+
+class TestFormatHandlerRegistry:
+    """Test format handler registration and lookup."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.registry = FormatHandlerRegistry()
+        self.registry.register("csv", CSVFormatHandler)
+
+    def test_lookup_is_case_insensitive(self):
+        """Test handlers are found regardless of format type case."""
+        assert isinstance(self.registry.get_handler("CSV"), CSVFormatHandler)
+        assert isinstance(self.registry.get_handler("Csv"), CSVFormatHandler)
+        assert self.registry.get_supported_formats() == ["CSV"]
+
+    def test_handler_instance_is_reused(self):
+        """Test repeated lookups return the same stateless handler."""
+        assert self.registry.get_handler("CSV") is self.registry.get_handler("csv")
+
+    def test_handler_with_instance_state_rejected(self):
+        """Test handlers that could hold per-instance state cannot be shared."""
+
+        class StatefulCSVHandler(CSVFormatHandler):
+            pass
+
+        with pytest.raises(TypeError, match="StatefulCSVHandler must declare __slots__"):
+            self.registry.register("stateful", StatefulCSVHandler)
+
+    def test_unsupported_format(self):
+        """Test unknown format types raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported format type: AVRO"):
+            self.registry.get_handler("AVRO")
@@ -1,11 +1,13 @@
 """Tests for Mockhaus data ingestion functionality."""
 
 import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
 
 from mockhaus import MockhausExecutor
+from mockhaus.snowflake import MockStageManager, Stage
 
 
 class TestDataIngestion(unittest.TestCase):
@@ -99,6 +101,16 @@ class TestDataIngestion(unittest.TestCase):
         expected_path = os.path.join("external", "s3", "my-bucket", "data")
         assert expected_path in stage.local_path
 
+    def test_external_stage_unmapped_url(self) -> None:
+        """Test that EXTERNAL stages with unmapped URL schemes use the stage name directory."""
+        stage_manager = self.stage_manager
+
+        stage = stage_manager.create_stage("https_stage", "EXTERNAL", "https://example.com/data/")
+        assert stage.local_path == str(stage_manager.external_path / "https_stage")
+
+        upper_stage = stage_manager.create_stage("upper_s3_stage", "EXTERNAL", "S3://my-bucket/data/")
+        assert os.path.join("external", "s3", "my-bucket", "data") in upper_stage.local_path
+
     def test_drop_stage(self) -> None:
         """Test dropping a stage."""
         # Create a stage first
@@ -116,6 +128,164 @@ class TestDataIngestion(unittest.TestCase):
         stage = self.stage_manager.get_stage("test_drop_stage")
         assert stage is None
 
+        # Dropping again reports the stage as missing
+        result = self.executor.execute_snowflake_sql("DROP STAGE test_drop_stage")
+        assert not result.success
+        assert result.error == "Stage test_drop_stage not found"
+
+    def test_stage_properties_round_trip(self) -> None:
+        """Test stage properties are stored and read back as a mapping."""
+        stage_manager = self.stage_manager
+
+        stage_manager.create_stage("props_stage", "USER", properties={"comment": "landing zone", "encryption": "SSE"})
+        stage = stage_manager.get_stage("props_stage")
+        assert stage is not None
+        assert stage.properties == {"comment": "landing zone", "encryption": "SSE"}
+
+        stage_manager.create_stage("no_props_stage", "USER")
+        listed = {stage.name: stage for stage in stage_manager.list_stages()}
+        assert listed["no_props_stage"].properties == {}
+        assert listed["props_stage"].properties == {"comment": "landing zone", "encryption": "SSE"}
+
+    def test_stage_managers_share_base_paths(self) -> None:
+        """Test that stage managers resolve the ~/.mockhaus layout once and share it."""
+        other = MockStageManager(self.executor._connection)
+
+        assert other.base_path == Path.home() / ".mockhaus"
+        assert other.base_path is self.stage_manager.base_path
+        assert other.external_path is self.stage_manager.external_path
+
+    def test_dropped_stage_table_is_recreated(self) -> None:
+        """Test that a new stage manager recreates mockhaus_stages on a connection that lost it."""
+        connection = self.executor._connection
+        assert connection is not None
+        connection.execute("DROP TABLE mockhaus_stages")
+
+        stage_manager = MockStageManager(connection)
+        stage_manager.create_stage("after_drop", "USER")
+        assert stage_manager.get_stage("after_drop") is not None
+
+    def test_json_properties_table_is_migrated(self) -> None:
+        """Test that a stage table with JSON properties from older releases is converted to a MAP column."""
+        import duckdb
+
+        connection = duckdb.connect()
+        connection.execute(
+            """
+            CREATE TABLE mockhaus_stages (
+                name VARCHAR PRIMARY KEY,
+                stage_type VARCHAR NOT NULL,
+                url VARCHAR,
+                local_path VARCHAR NOT NULL,
+                properties JSON,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        connection.execute(
+            "INSERT INTO mockhaus_stages (name, stage_type, local_path, properties) VALUES (?, ?, ?, ?)",
+            ["legacy", "USER", "/tmp/legacy", '{"comment": "old"}'],
+        )
+
+        stage_manager = MockStageManager(connection)
+        legacy = stage_manager.get_stage("legacy")
+        assert legacy is not None
+        assert legacy.properties == {"comment": "old"}
+
+        stage_manager.create_stage("fresh", "USER", properties={"comment": "new"})
+        fresh = stage_manager.get_stage("fresh")
+        assert fresh is not None
+        assert fresh.properties == {"comment": "new"}
+        connection.close()
+
+    def test_removed_stage_directory_is_recreated(self) -> None:
+        """Test that re-creating a stage restores a directory removed in the meantime."""
+        stage_dir = self.test_data_dir / "reused"
+        file_url = f"file://{stage_dir.as_posix()}"
+        self.stage_manager.create_stage("reused_stage", "EXTERNAL", file_url)
+        assert stage_dir.is_dir()
+
+        shutil.rmtree(stage_dir)
+        self.stage_manager.create_stage("reused_stage", "EXTERNAL", file_url)
+        assert stage_dir.is_dir()
+
+        shutil.rmtree(stage_dir)
+        self.stage_manager.ensure_stage_directory("@reused_stage/")
+        assert stage_dir.is_dir()
+
+    def test_stage_lookup_cache_invalidation(self) -> None:
+        """Test cached stage lookups stay consistent with create and drop."""
+        stage_manager = self.stage_manager
+
+        # A miss is not cached, so a stage created through another manager is found
+        assert stage_manager.get_stage("cached_stage") is None
+        MockStageManager(self.executor._connection).create_stage("cached_stage", "USER")
+        stage = stage_manager.get_stage("cached_stage")
+        assert stage is not None
+        assert stage.created_at is not None
+
+        # Each lookup returns its own copy, so changing one leaves the cache intact
+        stage.properties["comment"] = "changed"
+        stage.local_path = "/elsewhere"
+        cached = stage_manager.get_stage("cached_stage")
+        assert cached is not stage
+        assert cached is not None
+        assert cached.properties == {}
+        assert cached.local_path != "/elsewhere"
+
+        assert stage_manager.drop_stage("cached_stage")
+        assert stage_manager.get_stage("cached_stage") is None
+
+    def test_stage_recreated_through_another_manager(self) -> None:
+        """Test that a stage dropped and re-created by one manager is seen by another on the same connection."""
+        writer = MockStageManager(self.executor._connection)
+        reader = MockStageManager(self.executor._connection)
+
+        writer.create_stage("moved_stage", "EXTERNAL", "s3://bucket/one")
+        assert reader.resolve_stage_path("@moved_stage/f.csv") == f"{self.stage_manager.external_path}/s3/bucket/one/f.csv"
+
+        assert writer.drop_stage("moved_stage")
+        writer.create_stage("moved_stage", "EXTERNAL", "s3://bucket/two")
+        stage = reader.get_stage("moved_stage")
+        assert stage is not None
+        assert stage.url == "s3://bucket/two"
+        assert reader.resolve_stage_path("@moved_stage/f.csv") == f"{stage.local_path}/f.csv"
+        assert "bucket/two" in stage.local_path
+
+    def test_stage_cache_warmed_by_list_and_drop(self) -> None:
+        """Test that listing stages answers later lookups without a query, and dropping forgets them."""
+        stage_manager = self.stage_manager
+        stage_manager.create_stage("warm_a", "USER")
+        stage_manager.create_stage("warm_b", "USER")
+        listed = {stage.name: stage for stage in stage_manager.list_stages()}
+
+        def fail_fetch(name: str) -> None:
+            raise AssertionError(f"unexpected query for {name}")
+
+        stage_manager._fetch_stage = fail_fetch  # type: ignore[method-assign]
+        assert stage_manager.get_stage("warm_a") == listed["warm_a"]
+        assert stage_manager.resolve_stage_path("@warm_b/data.csv") == f"{listed['warm_b'].local_path}/data.csv"
+
+        assert stage_manager.drop_stage("warm_a")
+        del stage_manager._fetch_stage
+        assert stage_manager.get_stage("warm_a") is None
+
+    def test_is_data_ingestion_statement(self) -> None:
+        """Test detection of data ingestion statements."""
+        handler = self.executor._ingestion_handler
+        assert handler is not None
+
+        assert handler.is_data_ingestion_statement("CREATE STAGE my_stage")
+        assert handler.is_data_ingestion_statement("  create file format my_format TYPE = 'CSV'")
+        assert handler.is_data_ingestion_statement("COPY INTO my_table FROM @my_stage")
+        assert handler.is_data_ingestion_statement("DROP STAGE my_stage")
+        assert handler.is_data_ingestion_statement("drop\nfile format my_format")
+
+        assert not handler.is_data_ingestion_statement("CREATE TABLE my_table (id INT)")
+        assert not handler.is_data_ingestion_statement("DROP FILE my_format")
+        assert not handler.is_data_ingestion_statement("SELECT 1")
+        assert not handler.is_data_ingestion_statement("COPY")
+
     def test_create_csv_file_format(self) -> None:
         """Test creating a CSV file format."""
         sql = "CREATE FILE FORMAT test_csv_format TYPE = 'CSV' FIELD_DELIMITER = '|' SKIP_HEADER = 1"
@@ -337,6 +507,19 @@ class TestDataIngestion(unittest.TestCase):
         expected_named_path = str(Path.home() / ".mockhaus" / "stages" / "my_stage" / "file.csv")
         assert named_path == expected_named_path
 
+    def test_resolve_stage_paths_batch(self) -> None:
+        """Test resolving several stage references in one call."""
+        stage_manager = self.stage_manager
+        file_url = f"file://{self.test_data_dir.as_posix()}"
+        stage_manager.create_stage("batch_resolve_stage", "EXTERNAL", file_url)
+
+        references = ["@batch_resolve_stage/test.csv", "@~/user.csv", "@%my_table/data.csv", "@unknown_stage/file.csv", "plain"]
+        resolved = stage_manager.resolve_stage_paths(references)
+
+        assert resolved == [stage_manager.resolve_stage_path(ref) for ref in references]
+        assert resolved[0] == str(self.csv_file)
+        assert resolved[4] is None
+
     def test_file_format_property_mapping(self) -> None:
         """Test mapping of file format properties to DuckDB options."""
         format_manager = self.format_manager
@@ -403,6 +586,46 @@ class TestDataIngestion(unittest.TestCase):
         assert "stage1" in stage_names
         assert "stage2" in stage_names
 
+    def test_create_stages_batch(self) -> None:
+        """Test creating several stages in one batch."""
+        stage_manager = self.stage_manager
+        file_url = f"file://{self.test_data_dir.as_posix()}"
+
+        created = stage_manager.create_stages(
+            [
+                Stage(name="batch_user", stage_type="USER"),
+                Stage(name="batch_external", stage_type="EXTERNAL", url=file_url, properties={"comment": "batch"}),
+            ]
+        )
+
+        assert [stage.name for stage in created] == ["batch_user", "batch_external"]
+
+        user_stage = stage_manager.get_stage("batch_user")
+        assert user_stage is not None
+        assert user_stage.local_path == created[0].local_path
+
+        external_stage = stage_manager.get_stage("batch_external")
+        assert external_stage is not None
+        assert external_stage.local_path == str(self.test_data_dir)
+        assert external_stage.properties == {"comment": "batch"}
+
+    def test_create_stage_replaces_existing(self) -> None:
+        """Test that re-creating a stage updates it in place."""
+        stage_manager = self.stage_manager
+        original = stage_manager.create_stage("redefined", "USER", properties={"comment": "v1"})
+        assert original.created_at is None
+
+        first = stage_manager.get_stage("redefined")
+        assert first is not None
+
+        stage_manager.create_stage("redefined", "USER", properties={"comment": "v2"})
+
+        updated = stage_manager.get_stage("redefined")
+        assert updated is not None
+        assert updated.properties == {"comment": "v2"}
+        assert updated.created_at == first.created_at
+        assert len([stage for stage in stage_manager.list_stages() if stage.name == "redefined"]) == 1
+
     def test_list_file_formats(self) -> None:
         """Test listing all file formats."""
         format_manager = self.format_manager
@@ -432,6 +655,50 @@ class TestDataIngestion(unittest.TestCase):
         # Test invalid stage reference
         assert not stage_manager.validate_stage_access("@nonexistent_stage/file.csv")
 
+    def test_ensure_stage_directory(self) -> None:
+        """Test creating the directory behind a stage reference."""
+        stage_manager = self.stage_manager
+        file_url = f"file://{self.test_data_dir.as_posix()}"
+        stage_manager.create_stage("ensure_stage", "EXTERNAL", file_url)
+
+        # File references create their parent directory, directory references the directory itself
+        stage_manager.ensure_stage_directory("@ensure_stage/incoming/data.csv")
+        assert (self.test_data_dir / "incoming").is_dir()
+        assert not (self.test_data_dir / "incoming" / "data.csv").exists()
+
+        stage_manager.ensure_stage_directory("@ensure_stage/archive")
+        assert (self.test_data_dir / "archive").is_dir()
+        assert stage_manager.validate_stage_access("@ensure_stage/archive/data.csv")
+
+    def test_list_stage_files(self) -> None:
+        """Test listing files in a stage directory."""
+        stage_manager = self.stage_manager
+        (self.test_data_dir / "nested").mkdir()
+        (self.test_data_dir / "nested" / "inner.csv").write_text("id\n1")
+
+        file_url = f"file://{self.test_data_dir.as_posix()}"
+        stage_manager.create_stage("listing_stage", "EXTERNAL", file_url)
+
+        all_files = stage_manager.list_stage_files("@listing_stage/")
+        assert all_files == [str(self.csv_file), str(self.json_file)]
+
+        csv_files = stage_manager.list_stage_files("@listing_stage/", "*.csv")
+        assert csv_files == [str(self.csv_file)]
+
+        nested_files = stage_manager.list_stage_files("@listing_stage/", "*/*.csv")
+        assert nested_files == [str(self.test_data_dir / "nested" / "inner.csv")]
+
+        recursive_files = stage_manager.list_stage_files("@listing_stage/", "**/*.csv")
+        assert recursive_files == sorted([str(self.csv_file), str(self.test_data_dir / "nested" / "inner.csv")])
+
+        # The iterator yields the same files, in file system order
+        assert sorted(stage_manager.iter_stage_files("@listing_stage/", "*.csv")) == csv_files
+
+        # A file reference lists its directory; a missing directory lists nothing
+        assert stage_manager.list_stage_files("@listing_stage/test.csv", "*.json") == [str(self.json_file)]
+        assert stage_manager.list_stage_files("@listing_stage/missing/data.csv") == []
+        assert stage_manager.list_stage_files("not_a_stage_reference") == []
+
     def test_complex_copy_scenario(self) -> None:
         """Test a complex COPY INTO scenario with multiple files and formats."""
         # Create multiple CSV files with different formats
@@ -10,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 
 import sqlglot
 
-from mockhaus.snowflake.translator import SnowflakeToDuckDBTranslator
+from mockhaus.snowflake.translator import SnowflakeToDuckDBTranslator, _compile, _dialect, _parse, _passthrough_enabled
 from mockhaus.sqlglot.dialects import CustomSnowflake, Sysdate
 
 
@@ -21,6 +21,15 @@ class TestSysdateTranslation:
         """Set up test fixtures."""
         self.translator = SnowflakeToDuckDBTranslator()
 
+    @pytest.fixture(autouse=True)
+    def default_fast_path(self, monkeypatch):
+        """Run each test with the fast path at its default, whatever MOCKHAUS_TRANSLATION_FAST_PATH is set to outside."""
+        monkeypatch.delenv("MOCKHAUS_TRANSLATION_FAST_PATH", raising=False)
+        _passthrough_enabled.cache_clear()
+        yield
+        # The setting is read once; forget it so it is read again from the restored environment
+        _passthrough_enabled.cache_clear()
+
     def test_sysdate_parsing(self):
         """Test that SYSDATE() is parsed correctly with custom dialect."""
         sql = "SELECT SYSDATE() AS current_time FROM users"
@@ -124,9 +133,24 @@ class TestSysdateTranslation:
 
         assert info["success"] is True
         assert info["original_sql"] == sql
+        assert info["source_dialect"] == "CustomSnowflake"
+        assert info["target_dialect"] == "CustomDuckDB"
         assert "CURRENT_TIMESTAMP AT TIME ZONE 'UTC'" in info["translated_sql"]
         assert "sysdate_to_utc" in info["transformations_applied"]
 
+    def test_translation_info_sysdate_detection(self):
+        """Test that only real SYSDATE() calls are reported, not text that merely mentions it."""
+        info = self.translator.get_translation_info("select sysdate() as ts from users")
+        assert "sysdate_to_utc" in info["transformations_applied"]
+
+        info = self.translator.get_translation_info("SELECT 'SYSDATE()' AS label FROM users")
+        assert "sysdate_to_utc" not in info["transformations_applied"]
+
+    def test_translation_info_reports_identifier_rewrite(self):
+        """Test that IDENTIFIER('literal') rewrites are reported as a plain dialect translation."""
+        info = self.translator.get_translation_info("SELECT * FROM IDENTIFIER('users')")
+        assert info["transformations_applied"] == ["dialect_translation"]
+
     def test_sysdate_case_insensitive(self):
         """Test that SYSDATE() works with different cases."""
         # Note: This test might fail if the dialect is case-sensitive
@@ -198,3 +222,100 @@ class TestSysdateTranslation:
 
         # Should handle all SYSDATE() calls
         assert result.count("CURRENT_TIMESTAMP AT TIME ZONE 'UTC'") == 10
+
+    def test_repeated_translation_is_cached(self):
+        """Test that translating the same query twice reuses the cached result."""
+        sql = "SELECT SYSDATE() AS cached_time FROM users"
+        _compile.cache_clear()
+
+        first = self.translator.translate(sql)
+        second = SnowflakeToDuckDBTranslator().translate(sql)
+
+        assert first == second
+        assert _compile.cache_info().hits == 1
+
+    def test_translation_info_reuses_translate_parse(self):
+        """Test that get_translation_info reuses the parse done by translate."""
+        sql = "SELECT SYSDATE() AS shared_time FROM users"
+        _parse.cache_clear()
+
+        translated = self.translator.translate(sql, pretty=True)
+        info = self.translator.get_translation_info(sql)
+
+        assert info["translated_sql"] == translated
+        self.translator.translate(sql)
+        assert _parse.cache_info().misses == 1
+
+    def test_translate_pretty_flag(self):
+        """Test that translate emits compact SQL unless pretty output is requested."""
+        sql = "SELECT SYSDATE() AS ts, id FROM users WHERE id = 1"
+
+        compact = self.translator.translate(sql)
+        pretty = self.translator.translate(sql, pretty=True)
+
+        assert "\n" not in compact
+        assert "\n" in pretty
+        assert " ".join(pretty.split()) == compact
+
+    def test_plain_sql_passes_through(self):
+        """Test that statements already valid in DuckDB are returned without a sqlglot round trip."""
+        _compile.cache_clear()
+
+        for sql in [
+            "SELECT id, name FROM users WHERE id = 5",
+            "SELECT * FROM db.sch.t AS x JOIN u ON x.a = u.a WHERE x.b IS NOT NULL LIMIT 10",
+            "UPDATE users SET name = 'bob' WHERE id = 2",
+            "DELETE FROM users WHERE name ILIKE 'a%'",
+        ]:
+            assert self.translator.translate(sql) == sql
+
+        assert _compile.cache_info().misses == 0
+
+    def test_order_by_keeps_snowflake_null_ordering(self):
+        """Test that ORDER BY skips the fast path, since Snowflake and DuckDB place NULLs differently."""
+        _compile.cache_clear()
+
+        sql = "SELECT * FROM db.sch.t AS x JOIN u ON x.a = u.a ORDER BY x.a DESC LIMIT 10"
+        assert self.translator.translate(sql) == "SELECT * FROM db.sch.t AS x JOIN u ON x.a = u.a ORDER BY x.a DESC NULLS FIRST LIMIT 10"
+        assert self.translator.translate("SELECT id FROM users ORDER BY id DESC") == "SELECT id FROM users ORDER BY id DESC NULLS FIRST"
+        assert _compile.cache_info().misses == 2
+
+    def test_dialect_specific_sql_is_translated(self):
+        """Test that statements that may need rewriting still go through sqlglot."""
+        statements = [
+            "SELECT TOP 5 id FROM users",
+            "SELECT id FROM users ORDER BY id NULLS LAST",
+            "SELECT localtimestamp",
+            "SELECT a * b FROM t",
+            "SELECT name FROM users WHERE name = 'it\\'s'",
+            "SELECT SYSDATE() FROM users",
+        ]
+        _compile.cache_clear()
+
+        for sql in statements:
+            self.translator.translate(sql)
+
+        assert _compile.cache_info().misses == len(statements)
+
+    def test_passthrough_can_be_disabled(self, monkeypatch):
+        """Test that MOCKHAUS_TRANSLATION_FAST_PATH=false forces full translation."""
+        monkeypatch.setenv("MOCKHAUS_TRANSLATION_FAST_PATH", "false")
+        _passthrough_enabled.cache_clear()
+        _compile.cache_clear()
+
+        self.translator.translate("SELECT id FROM users")
+        assert _compile.cache_info().misses == 1
+
+    def test_dialect_instances_are_shared(self):
+        """Test that translation reuses one instance per dialect class."""
+        from mockhaus.sqlglot.dialects import CustomDuckDB
+
+        assert _dialect(CustomSnowflake) is _dialect(CustomSnowflake)
+        assert isinstance(_dialect(CustomDuckDB), CustomDuckDB)
+
+        _dialect.cache_clear()
+        _compile.cache_clear()
+        self.translator.translate("SELECT SYSDATE() AS ts")
+        self.translator.translate("SELECT SYSDATE() AS other_ts")
+
+        assert _dialect.cache_info().currsize == 2
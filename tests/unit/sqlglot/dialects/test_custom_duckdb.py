@@ -7,6 +7,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / "src"))
 
 import sqlglot
+from sqlglot import expressions as exp
 
 from mockhaus.sqlglot.dialects import CustomDuckDB
 
@@ -102,6 +103,7 @@ class TestCustomDuckDBDialect:
         # This will likely cause an error in DuckDB, which is appropriate behavior
         assert "$table_name" in duckdb_sql
         assert "IDENTIFIER(" in duckdb_sql  # Should keep IDENTIFIER for variables
+        assert parsed.sql(dialect=CustomDuckDB) == "SELECT * FROM IDENTIFIER($table_name)"
 
     def test_custom_generator_handles_identifier(self):
         """Test that the custom generator properly handles IdentifierFunc expressions."""
@@ -120,3 +122,72 @@ class TestCustomDuckDBDialect:
         # This should transform to unquoted identifier
         result = generator.sql(identifier_expr)
         assert result == "my_table"
+
+    def test_generator_transforms_built_once(self):
+        """Test that the dialect's generator shares the single TRANSFORMS mapping."""
+        from sqlglot.dialects.duckdb import DuckDB
+
+        from mockhaus.sqlglot.dialects import IdentifierFunc, Sysdate
+        from mockhaus.sqlglot.dialects.custom_duckdb import CustomDuckDBGenerator
+
+        assert CustomDuckDB.Generator is CustomDuckDBGenerator
+        assert CustomDuckDB().generator_class is CustomDuckDBGenerator
+        assert CustomDuckDBGenerator.TRANSFORMS is not DuckDB.Generator.TRANSFORMS
+        assert Sysdate not in DuckDB.Generator.TRANSFORMS
+        assert Sysdate in CustomDuckDBGenerator.TRANSFORMS
+        assert IdentifierFunc in CustomDuckDBGenerator.TRANSFORMS
+
+    def test_single_custom_generator_class(self):
+        """Test that only one CustomDuckDBGenerator class is ever created."""
+        from sqlglot.dialects.duckdb import DuckDB
+
+        generators = [cls for cls in DuckDB.Generator.__subclasses__() if cls.__name__ == "CustomDuckDBGenerator"]
+        assert len(generators) == 1
+        assert generators[0].anonymous_sql is not DuckDB.Generator.anonymous_sql
+
+    def test_sysdate_parentheses_context(self):
+        """Test that SYSDATE is parenthesized in CREATE statements and column definitions only."""
+        from mockhaus.sqlglot.dialects import CustomSnowflake
+
+        def translate(sql: str) -> str:
+            return sqlglot.parse_one(sql, read=CustomSnowflake).sql(dialect=CustomDuckDB)
+
+        utc = "CURRENT_TIMESTAMP AT TIME ZONE 'UTC'"
+        assert translate("CREATE TABLE t (ts TIMESTAMP DEFAULT SYSDATE(), ts2 TIMESTAMP DEFAULT SYSDATE())").count(f"({utc})") == 2
+        assert translate("CREATE TABLE t AS SELECT SYSDATE() AS ts") == f"CREATE TABLE t AS SELECT ({utc}) AS ts"
+        assert translate("ALTER TABLE t ADD COLUMN ts TIMESTAMP DEFAULT SYSDATE()").endswith(f"DEFAULT ({utc})")
+        assert translate("SELECT SYSDATE() - 1") == f"SELECT {utc} - 1"
+
+    def test_identifier_literal_quoting(self):
+        """Test that IDENTIFIER() literals are only quoted when DuckDB requires it."""
+        from mockhaus.sqlglot.dialects import CustomSnowflake
+
+        def translate(name: str) -> str:
+            return sqlglot.parse_one(f"SELECT * FROM IDENTIFIER('{name}')", read=CustomSnowflake).sql(dialect=CustomDuckDB)
+
+        assert translate("my_table") == "SELECT * FROM my_table"
+        assert translate("MyTable") == "SELECT * FROM MyTable"
+        assert translate("order") == 'SELECT * FROM "order"'
+        assert translate("1abc") == 'SELECT * FROM "1abc"'
+        assert translate("a b") == 'SELECT * FROM "a b"'
+
+    def test_sysdate_parentheses_from_generator_context(self):
+        """Test that SYSDATE parentheses follow the column definitions being generated, even in hand-built ASTs."""
+        from mockhaus.sqlglot.dialects import Sysdate
+
+        column = exp.ColumnDef(
+            this=exp.to_identifier("ts"),
+            kind=exp.DataType.build("TIMESTAMP"),
+            constraints=[exp.ColumnConstraint(kind=exp.DefaultColumnConstraint(this=Sysdate()))],
+        )
+        alter = exp.Alter(this=exp.to_table("t"), kind="TABLE", actions=[column])
+
+        assert alter.sql(dialect=CustomDuckDB).endswith("DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC')")
+        assert exp.select(Sysdate()).sql(dialect=CustomDuckDB) == "SELECT CURRENT_TIMESTAMP AT TIME ZONE 'UTC'"
+
+        # Parsed statements give the same result, however often they are generated
+        from mockhaus.sqlglot.dialects import CustomSnowflake
+
+        parsed = sqlglot.parse_one("ALTER TABLE t ADD COLUMN ts TIMESTAMP DEFAULT SYSDATE()", read=CustomSnowflake)
+        for _ in range(2):
+            assert parsed.sql(dialect=CustomDuckDB).endswith("DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC')")
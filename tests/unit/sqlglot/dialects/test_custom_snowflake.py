@@ -94,3 +94,32 @@ class TestCustomSnowflakeDialect:
         # Should parse without errors
         assert parsed is not None
         assert str(parsed).upper().find("CURRENT_TIMESTAMP") != -1
+
+    def test_parser_and_generator_tables_built_once(self):
+        """Test that the dialect shares one FUNCTIONS and TRANSFORMS mapping without touching Snowflake's."""
+        from sqlglot.dialects.snowflake import Snowflake
+
+        from mockhaus.sqlglot.dialects.custom_snowflake import CustomSnowflakeGenerator, CustomSnowflakeParser
+
+        assert CustomSnowflake.Parser is CustomSnowflakeParser
+        assert CustomSnowflake.Generator is CustomSnowflakeGenerator
+        assert "SYSDATE" in CustomSnowflakeParser.FUNCTIONS
+        assert Sysdate in CustomSnowflakeGenerator.TRANSFORMS
+        assert Sysdate not in Snowflake.Generator.TRANSFORMS
+        assert Snowflake.Parser.FUNCTIONS.get("IDENTIFIER") is not CustomSnowflakeParser.FUNCTIONS["IDENTIFIER"]
+
+    def test_single_custom_expression_classes(self):
+        """Test that Sysdate and IdentifierFunc are each defined once, so isinstance checks agree across modules."""
+        from mockhaus.sqlglot.dialects import custom_duckdb, custom_snowflake
+
+        for name in ("Sysdate", "IdentifierFunc"):
+            classes = [cls for cls in expressions.Func.__subclasses__() if cls.__name__ == name]
+            assert len(classes) == 1
+        assert custom_snowflake.Sysdate is custom_duckdb.Sysdate is Sysdate
+        assert custom_snowflake.IdentifierFunc is custom_duckdb.IdentifierFunc is IdentifierFunc
+
+    def test_identifier_round_trip(self):
+        """Test that IDENTIFIER() is regenerated unchanged in the Snowflake dialect."""
+        for sql in ["SELECT IDENTIFIER('col_name') FROM my_table", "SELECT * FROM IDENTIFIER($table_name)"]:
+            parsed = sqlglot.parse_one(sql, dialect=CustomSnowflake)
+            assert parsed.sql(dialect=CustomSnowflake) == sql